@@ -1,15 +1,33 @@
 import os
+import atexit
 import json
 import time
 import logging
 import threading
+import random
 import re
+import functools
+import hashlib
+import collections
+import concurrent.futures
+import cProfile
+import multiprocessing
+import shutil
+import socket
+import sqlite3
+import tempfile
+import tracemalloc
+import warnings
+from contextlib import contextmanager
 
 import dash
 from dash import dcc, html
+import flask
 import gspread
 import mysql.connector
+import numpy as np
 import pandas as pd
+import plotly
 import plotly.express as px
 from oauth2client.service_account import ServiceAccountCredentials
 
@@ -39,14 +57,213 @@ DASHBOARD_REFRESH_SECONDS = int(os.getenv("DASHBOARD_REFRESH_SECONDS", "60"))
 ENABLE_SOURCE_FALLBACK = os.getenv("ENABLE_SOURCE_FALLBACK", "false").lower() == "true"
 MYSQL_CONNECT_TIMEOUT_SECONDS = int(os.getenv("MYSQL_CONNECT_TIMEOUT_SECONDS", "5"))
 MYSQL_READ_TIMEOUT_SECONDS = int(os.getenv("MYSQL_READ_TIMEOUT_SECONDS", "15"))
-RUN_SYNC_IN_REQUEST = os.getenv("RUN_SYNC_IN_REQUEST", "false").lower() == "true"
 DASHBOARD_CACHE_SECONDS = int(os.getenv("DASHBOARD_CACHE_SECONDS", "120"))
 PREWARM_CACHE_ON_START = os.getenv("PREWARM_CACHE_ON_START", "true").lower() == "true"
-_last_sync_epoch = 0.0
+SYNC_BATCH_SIZE = int(os.getenv("SYNC_BATCH_SIZE", "500"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+AGGREGATE_VERIFY_SECONDS = int(os.getenv("AGGREGATE_VERIFY_SECONDS", "3600"))
+NUMERIC_HISTOGRAM_BINS = int(os.getenv("NUMERIC_HISTOGRAM_BINS", "30"))
+FIGURE_CACHE_SIZE = int(os.getenv("FIGURE_CACHE_SIZE", "256"))
+DASHBOARD_BUILD_WORKERS = int(os.getenv("DASHBOARD_BUILD_WORKERS", "1"))
+LAZY_CHARTS_PAGE_SIZE = max(1, int(os.getenv("LAZY_CHARTS_PAGE_SIZE", "6")))
+DASHBOARD_BUILD_EXECUTOR = os.getenv("DASHBOARD_BUILD_EXECUTOR", "thread").strip().lower()
+DASHBOARD_SHARED_CACHE_PATH = os.getenv(
+    "DASHBOARD_SHARED_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "gamer-preferences-dashboard-cache.sqlite3"),
+).strip()
+DASHBOARD_REFRESH_LEASE_SECONDS = int(os.getenv("DASHBOARD_REFRESH_LEASE_SECONDS", "120"))
+COLD_START_WAIT_SECONDS = float(os.getenv("COLD_START_WAIT_SECONDS", "30"))
+SQL_STREAM_CHUNK_ROWS = int(os.getenv("SQL_STREAM_CHUNK_ROWS", "5000"))
+SQL_STREAM_TRACE_MEMORY = os.getenv("SQL_STREAM_TRACE_MEMORY", "false").lower() == "true"
+CROSS_FILTER_MAX_VALUES = int(os.getenv("CROSS_FILTER_MAX_VALUES", "256"))
+ASSOCIATION_MAX_VALUES = int(os.getenv("ASSOCIATION_MAX_VALUES", "50"))
+TIMESTAMP_DAYFIRST = os.getenv("TIMESTAMP_DAYFIRST", "true").lower() == "true"
+TREND_DAYS = int(os.getenv("TREND_DAYS", "365"))
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_DIR = os.getenv(
+    "SNAPSHOT_DIR",
+    os.path.join(tempfile.gettempdir(), "gamer-preferences-snapshot"),
+).strip()
+SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("SNAPSHOT_INTERVAL_SECONDS", "900"))
+SCHEDULER_JITTER_RATIO = float(os.getenv("SCHEDULER_JITTER_RATIO", "0.1"))
+SCHEDULER_RETRY_SECONDS = float(os.getenv("SCHEDULER_RETRY_SECONDS", "5"))
+SCHEDULER_MAX_BACKOFF_SECONDS = float(os.getenv("SCHEDULER_MAX_BACKOFF_SECONDS", "600"))
+PROFILE_REQUESTS_DIR = os.getenv("PROFILE_REQUESTS_DIR", "").strip()
+PROFILE_REQUESTS_SAMPLE_RATE = float(os.getenv("PROFILE_REQUESTS_SAMPLE_RATE", "1.0"))
+_sync_schema_ready = False
+_sync_unique_key_ready = False
 _last_dashboard_epoch = 0.0
-_cached_dashboard_children = None
-_cache_refresh_in_progress = False
+_cached_dashboard = None
+_cached_dashboard_version = None
 _cache_lock = threading.Lock()
+dashboard_payload_report = {}
+dashboard_build_timings = {}
+
+
+def _format_labels(pairs) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in pairs) + "}" if pairs else ""
+
+
+def _format_sample_value(value: float) -> str:
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class Metric:
+    """A named family of samples, one per label combination, rendered as Prometheus text."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, self._format(key), value) for key, value in sorted(self._values.items())]
+
+    def _format(self, key, extra=()) -> str:
+        return _format_labels([*zip(self.labelnames, key), *extra])
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name}{labels} {_format_sample_value(value)}" for name, labels, value in self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """A gauge set directly, or read from ``function`` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), function=None):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self):
+        if self.function is None:
+            return super().samples()
+        try:
+            value = self.function()
+        except Exception:
+            logger.exception("Failed reading gauge %s", self.name)
+            value = float("nan")
+        return [(self.name, "", value)]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[0][position] += 1
+            counts[1] += 1
+            counts[2] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, (list(counts[0]), counts[1], counts[2])) for key, counts in self._values.items())
+        samples = []
+        for key, (buckets, count, total) in values:
+            for bound, bucket_count in zip(self.buckets, buckets):
+                samples.append((f"{self.name}_bucket", self._format(key, [("le", repr(bound))]), bucket_count))
+            samples.append((f"{self.name}_bucket", self._format(key, [("le", "+Inf")]), count))
+            samples.append((f"{self.name}_count", self._format(key), count))
+            samples.append((f"{self.name}_sum", self._format(key), total))
+        return samples
+
+
+class MetricsRegistry:
+    """The process's metrics; each gunicorn worker keeps and serves its own."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+metrics = MetricsRegistry()
+stage_seconds = metrics.register(
+    Histogram("survey_stage_seconds", "Wall time of each refresh and request stage.", ["stage"])
+)
+source_loads = metrics.register(
+    Counter("survey_source_loads_total", "Dashboard data loads by source and outcome.", ["source", "result"])
+)
+rows_synced = metrics.register(Counter("survey_rows_synced_total", "Sheet rows inserted into MySQL by the sync."))
+figure_cache_requests = metrics.register(
+    Counter("survey_figure_cache_requests_total", "Figure cache lookups by result.", ["result"])
+)
+dashboard_polls = metrics.register(
+    Counter(
+        "survey_dashboard_polls_total",
+        "Dashboard polls by outcome: unchanged (client current), sent, cold or unavailable.",
+        ["result"],
+    )
+)
+job_failures = metrics.register(Counter("survey_job_failures_total", "Failed scheduler runs by job.", ["job"]))
+
+
+def timed(stage: str):
+    """Decorator recording each call's wall time in ``survey_stage_seconds``."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_seconds.time(stage=stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
 
 
 color_discrete = [
@@ -89,17 +306,25 @@ def normalize_text(value: str) -> str:
     return " ".join(re.sub(r"[^a-z0-9]+", " ", str(value).lower()).split())
 
 
-def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
-    normalized = df.copy()
-    normalized.columns = [str(column).strip() for column in normalized.columns]
-    lower_to_actual = {column.lower(): column for column in normalized.columns}
-    normalized_to_actual = {normalize_text(column): column for column in normalized.columns}
+@functools.lru_cache(maxsize=64)
+def resolve_column_aliases(columns: tuple) -> tuple:
+    """Return the canonical name for each column of a header.
+
+    Cached by header signature, so repeated loads of the same sheet or table
+    skip alias matching entirely.
+    """
+    names = [str(column).strip() for column in columns]
+    lower_to_actual = {name.lower(): name for name in names}
+    normalized_to_actual = {normalize_text(name): name for name in names}
+
+    def rename(old: str, new: str) -> None:
+        names[:] = [new if name == old else name for name in names]
 
     for canonical, candidates in COLUMN_ALIASES.items():
         existing = lower_to_actual.get(canonical)
         if existing:
             if existing != canonical:
-                normalized = normalized.rename(columns={existing: canonical})
+                rename(existing, canonical)
             continue
 
         for candidate in candidates:
@@ -107,12 +332,61 @@ def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
             if not actual:
                 actual = normalized_to_actual.get(normalize_text(candidate))
             if actual:
-                normalized = normalized.rename(columns={actual: canonical})
+                rename(actual, canonical)
                 break
 
+    return tuple(names)
+
+
+@timed("normalize")
+def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
+    normalized = df.copy(deep=False)
+    normalized.columns = list(resolve_column_aliases(tuple(df.columns)))
     return normalized
 
 
+MULTISELECT_COLUMN_HINTS = (
+    "genres",
+    "genre",
+    "géneros",
+    "generos",
+    "what game genres do you enjoy the most",
+    "what games do you enjoy the most",
+    "select up to 2",
+    "select up to two",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def is_multiselect_column(column_name: str) -> bool:
+    normalized_col = normalize_text(column_name)
+    return any(normalize_text(hint) in normalized_col for hint in MULTISELECT_COLUMN_HINTS)
+
+
+def split_multiselect(values) -> pd.DataFrame:
+    """Split multiselect answers into one ``(row, value)`` pair per distinct option, in row order.
+
+    ``row`` is the answer's position in ``values``. Options are separated by
+    commas or semicolons; blank answers become a single "Missing" option. The
+    options table, the encoded store and the chart fallback all split through
+    here, so their counts agree.
+    """
+    values = pd.Series(np.asarray(values, dtype=object))
+    options = (
+        values.where(values.notna(), "Missing")
+        .astype(str)
+        .str.replace(";", ",", regex=False)
+        .str.split(",")
+        .explode()
+        .str.strip()
+    )
+    options = options[options != ""]
+    unanswered = np.setdiff1d(np.arange(len(values)), options.index.to_numpy())
+    options = pd.concat([options, pd.Series("Missing", index=unanswered, dtype=object)])
+    pairs = pd.DataFrame({"row": options.index.to_numpy(dtype=np.int64), "value": options.to_numpy(dtype=object)})
+    return pairs.drop_duplicates().sort_values("row", kind="stable", ignore_index=True)
+
+
 def get_db_connection():
     return mysql.connector.connect(
         host=os.getenv("DB_HOST", "localhost"),
@@ -125,7 +399,148 @@ def get_db_connection():
     )
 
 
-def fetch_google_sheet_dataframe() -> pd.DataFrame:
+class ConnectionPool:
+    """Bounded pool of database connections shared by every thread in the worker.
+
+    Connections are validated with ``ping`` on checkout, replaced once older than
+    ``recycle_seconds``, and checkouts wait at most ``timeout`` seconds for a free
+    slot before raising ``TimeoutError``.
+    """
+
+    def __init__(self, factory, size: int, timeout: float, recycle_seconds: int, pre_ping: bool = True):
+        self._factory = factory
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.recycle_seconds = recycle_seconds
+        self.pre_ping = pre_ping
+        self._idle = []
+        self._created_at = {}
+        self._open = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._counters = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "invalidated": 0,
+        }
+
+    def _create(self):
+        conn = self._factory()
+        with self._cond:
+            self._created_at[id(conn)] = time.time()
+            self._counters["created"] += 1
+        return conn
+
+    def _discard(self, conn, reason: str) -> None:
+        with self._cond:
+            self._created_at.pop(id(conn), None)
+            self._counters[reason] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_usable(self, conn) -> bool:
+        if time.time() - self._created_at.get(id(conn), 0.0) > self.recycle_seconds:
+            self._discard(conn, "recycled")
+            return False
+        if self.pre_ping:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                self._discard(conn, "invalidated")
+                return False
+        return True
+
+    def acquire(self):
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        waited = False
+        with self._cond:
+            while not self._idle and self._open >= self.size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise TimeoutError(f"No database connection available after {self.timeout:.1f}s")
+                waited = True
+                self._cond.wait(remaining)
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._open += 1
+            self._in_use += 1
+            self._counters["checkouts"] += 1
+            if waited:
+                self._counters["waits"] += 1
+                self._counters["wait_seconds"] += time.perf_counter() - started
+
+        try:
+            if conn is not None and not self._is_usable(conn):
+                conn = None
+            return conn if conn is not None else self._create()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn) -> None:
+        try:
+            # Ends any implicit read transaction so the next checkout sees fresh rows.
+            conn.rollback()
+            keep = True
+        except Exception:
+            keep = False
+            self._discard(conn, "invalidated")
+
+        with self._cond:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(conn)
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                **self._counters,
+            }
+
+    def close_all(self) -> None:
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn in idle:
+            self._discard(conn, "recycled")
+
+
+db_pool = ConnectionPool(
+    lambda: get_db_connection(),
+    size=DB_POOL_SIZE,
+    timeout=DB_POOL_TIMEOUT_SECONDS,
+    recycle_seconds=DB_POOL_RECYCLE_SECONDS,
+    pre_ping=DB_POOL_PRE_PING,
+)
+
+
+def open_google_worksheet():
     scope = [
         "https://spreadsheets.google.com/feeds",
         "https://www.googleapis.com/auth/drive",
@@ -148,88 +563,1362 @@ def fetch_google_sheet_dataframe() -> pd.DataFrame:
         raise ValueError("GOOGLE_SHEET_NAME is required for synchronization.")
 
     spreadsheet = client.open(sheet_name)
-    worksheet = spreadsheet.worksheet(worksheet_name) if worksheet_name else spreadsheet.sheet1
-    records = worksheet.get_all_records()
-    return pd.DataFrame(records)
+    return spreadsheet.worksheet(worksheet_name) if worksheet_name else spreadsheet.sheet1
+
+
+class SheetsReader:
+    """Keeps the worksheet handle and where the sheet ended, and reads from a caller's position.
+
+    Between reads only the header, the row count and the last row are kept; rows
+    are handed to the caller, who tracks its own position. Each read issues a
+    single ``batch_get`` for the header plus the range from the caller's position
+    (or the last known row, if earlier). The full sheet is re-read only when the
+    header changed or that last row no longer matches, i.e. rows were edited or
+    removed above the tail. The caller whose read triggers it gets a frame
+    starting at row 0; ``generation`` counts full reads, and every frame carries
+    it in ``attrs["generation"]`` so callers sharing the reader notice the
+    re-reads triggered by another caller.
+    """
+
+    def __init__(self, worksheet_factory):
+        self._worksheet_factory = worksheet_factory
+        self._worksheet = None
+        self._header = None
+        self._row_count = 0
+        self._last_row = None
+        self._lock = threading.Lock()
+        self.api_calls = 0
+        self.full_reads = 0
+        self.generation = 0
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def _clean_row(self, row):
+        width = len(self._header)
+        row = list(row[:width]) + [""] * (width - len(row))
+        return gspread.utils.numericise_all(row, default_blank="")
+
+    def _frame(self, rows, start: int) -> pd.DataFrame:
+        frame = pd.DataFrame(rows, columns=list(self._header), index=pd.RangeIndex(start, start + len(rows)))
+        frame.attrs["generation"] = self.generation
+        return frame
+
+    def _full_read(self, worksheet) -> pd.DataFrame:
+        self.api_calls += 1
+        values = worksheet.get_all_values()
+        self.full_reads += 1
+        self.generation += 1
+        self._header = [str(value) for value in values[0]] if values else []
+        rows = [self._clean_row(row) for row in values[1:]]
+        self._row_count = len(rows)
+        self._last_row = rows[-1] if rows else None
+        return self._frame(rows, 0)
+
+    @timed("sheets_read")
+    def read(self, start: int = 0) -> pd.DataFrame:
+        """Return the rows from position ``start`` on, indexed by their position in the sheet.
+
+        After a full re-read the frame starts at 0 whatever ``start`` was, since
+        rows above the caller's position may have changed.
+        """
+        with self._lock:
+            try:
+                if self._worksheet is None:
+                    self._worksheet = self._worksheet_factory()
+                worksheet = self._worksheet
+
+                if not self._header or not self._row_count:
+                    return self._full_read(worksheet)
+
+                first = min(start, self._row_count - 1)
+                last_column = re.sub(r"\d", "", gspread.utils.rowcol_to_a1(1, len(self._header)))
+                self.api_calls += 1
+                header_range, tail_range = worksheet.batch_get(["1:1", f"A{first + 2}:{last_column}"])
+                header = [str(value) for value in (header_range[0] if header_range else [])]
+                last_known = self._row_count - 1 - first
+                if (
+                    header != self._header
+                    or len(tail_range) <= last_known
+                    or self._clean_row(tail_range[last_known]) != self._last_row
+                ):
+                    return self._full_read(worksheet)
+
+                self._row_count = first + len(tail_range)
+                self._last_row = self._clean_row(tail_range[-1])
+                return self._frame([self._clean_row(row) for row in tail_range[start - first :]], start)
+            except Exception:
+                self._worksheet = None
+                raise
 
 
-def sync_google_sheet_to_mysql() -> None:
-    global _last_sync_epoch
+sheets_reader = SheetsReader(open_google_worksheet)
 
-    if not SYNC_FROM_GOOGLE_SHEETS:
+
+RESPONSE_COLUMNS = [
+    "timestamp",
+    "play_frequency",
+    "platform",
+    "genres",
+    "matters_most",
+    "preference",
+    "story_importance",
+    "romance_importance",
+    "romance_engagement",
+    "romance_preference",
+    "player_gender",
+    "identity",
+    "orientation_importance",
+    "orientation",
+    "inclusive_interest",
+]
+
+MULTISELECT_COLUMNS = [column for column in RESPONSE_COLUMNS if is_multiselect_column(column)]
+
+SYNC_STATE_KEY = "google_sheets"
+OPTIONS_STATE_KEY = "survey_response_options"
+TRENDS_STATE_KEY = "survey_response_trends"
+TREND_COLUMNS = ["story_importance", "romance_importance"]
+
+INSERT_RESPONSE_SQL = (
+    "INSERT IGNORE INTO survey_responses ("
+    + ", ".join(RESPONSE_COLUMNS)
+    + ") VALUES ("
+    + ", ".join(["%s"] * len(RESPONSE_COLUMNS))
+    + ")"
+)
+
+
+INSERT_OPTION_SQL = "INSERT IGNORE INTO survey_response_options (response_id, column_name, value) VALUES (%s, %s, %s)"
+UPSERT_TREND_SQL = (
+    "INSERT INTO survey_response_trends (bucket_date, column_name, value, responses) VALUES (%s, %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE responses = responses + VALUES(responses)"
+)
+
+
+def _is_already_exists_error(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return "duplicate key name" in message or "already exists" in message
+
+
+def ensure_sync_schema(conn) -> None:
+    """Create the watermark table and the unique key on timestamp once per process."""
+    global _sync_schema_ready, _sync_unique_key_ready
+
+    if _sync_schema_ready:
+        return
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                name VARCHAR(64) PRIMARY KEY,
+                row_index INT NOT NULL,
+                last_timestamp VARCHAR(64),
+                updated_at DOUBLE
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS survey_response_options (
+                response_id INT NOT NULL,
+                column_name VARCHAR(64) NOT NULL,
+                value VARCHAR(255) NOT NULL,
+                PRIMARY KEY (response_id, column_name, value)
+            )
+            """
+        )
+        try:
+            cursor.execute(
+                "CREATE INDEX ix_survey_response_options_column_value ON survey_response_options (column_name, value)"
+            )
+        except Exception as exc:
+            if not _is_already_exists_error(exc):
+                raise
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS survey_response_trends (
+                bucket_date DATE NOT NULL,
+                column_name VARCHAR(64) NOT NULL,
+                value VARCHAR(255) NOT NULL,
+                responses INT NOT NULL,
+                PRIMARY KEY (bucket_date, column_name, value)
+            )
+            """
+        )
+        try:
+            cursor.execute("CREATE UNIQUE INDEX ux_survey_responses_timestamp ON survey_responses (timestamp)")
+            _sync_unique_key_ready = True
+        except Exception as exc:
+            _sync_unique_key_ready = _is_already_exists_error(exc)
+            if not _sync_unique_key_ready:
+                logger.warning("Could not add unique key on survey_responses.timestamp: %s", exc)
+        conn.commit()
+        backfill_response_options(conn, cursor)
+        backfill_trend_counts(conn, cursor)
+    finally:
+        cursor.close()
+
+    _sync_schema_ready = True
+
+
+def explode_option_rows(response_ids, frame: pd.DataFrame) -> list:
+    """Vectorized ``(response_id, column_name, value)`` rows for every multiselect column."""
+    option_rows = []
+    ids = np.asarray(response_ids)
+    for column in MULTISELECT_COLUMNS:
+        if column not in frame.columns:
+            continue
+        pairs = split_multiselect(frame[column])
+        option_rows.extend(
+            zip(ids[pairs["row"].to_numpy()].tolist(), [column] * len(pairs), pairs["value"].tolist())
+        )
+    return option_rows
+
+
+def backfill_response_options(conn, cursor) -> None:
+    """Explode multiselect answers of rows stored before the options table existed."""
+    if has_sync_state(cursor, OPTIONS_STATE_KEY):
         return
 
-    current_time = time.time()
-    if current_time - _last_sync_epoch < SYNC_INTERVAL_SECONDS:
+    select_columns = ", ".join(["id"] + MULTISELECT_COLUMNS)
+    last_id = 0
+    while True:
+        cursor.execute(
+            f"SELECT {select_columns} FROM survey_responses WHERE id > %s ORDER BY id LIMIT %s",
+            (last_id, SYNC_BATCH_SIZE),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        frame = pd.DataFrame(rows, columns=["id"] + MULTISELECT_COLUMNS)
+        cursor.executemany(INSERT_OPTION_SQL, explode_option_rows(frame["id"], frame))
+        last_id = rows[-1][0]
+        conn.commit()
+
+    save_sync_watermark(cursor, last_id, None, OPTIONS_STATE_KEY)
+    conn.commit()
+
+
+def insert_response_options(cursor, rows) -> None:
+    """Store the exploded multiselect options of freshly inserted response rows."""
+    if not MULTISELECT_COLUMNS or not rows:
         return
 
-    sheet_df = normalize_dataframe_columns(fetch_google_sheet_dataframe())
-    if sheet_df.empty:
-        _last_sync_epoch = current_time
+    placeholders = ", ".join(["%s"] * len(rows))
+    cursor.execute(
+        f"SELECT id, timestamp FROM survey_responses WHERE timestamp IN ({placeholders})",
+        [row[0] for row in rows],
+    )
+    ids = pd.DataFrame(cursor.fetchall(), columns=["id", "timestamp"])
+    ids["timestamp"] = ids["timestamp"].astype(str)
+
+    frame = pd.DataFrame(rows, columns=RESPONSE_COLUMNS).merge(ids, on="timestamp", how="inner")
+    option_rows = explode_option_rows(frame["id"], frame)
+    if option_rows:
+        cursor.executemany(INSERT_OPTION_SQL, option_rows)
+
+
+def timestamp_days(values) -> np.ndarray:
+    """Parse sheet timestamps to days since the epoch; -1 where a value does not parse."""
+    text = pd.Series(values, dtype=object).astype("string").str.strip()
+    iso = text.str.match(r"\d{4}-").fillna(False).to_numpy(dtype=bool)
+    parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        # ISO stamps are never day-first; sheet-locale stamps follow TIMESTAMP_DAYFIRST,
+        # with the format inferred once and stragglers re-parsed one by one.
+        parsed[iso] = pd.to_datetime(text[iso], errors="coerce", format="ISO8601")
+        parsed[~iso] = pd.to_datetime(text[~iso], errors="coerce", dayfirst=TIMESTAMP_DAYFIRST)
+        retry = parsed.isna() & text.notna() & (text != "")
+        if retry.any():
+            parsed[retry] = pd.to_datetime(text[retry], errors="coerce", format="mixed", dayfirst=TIMESTAMP_DAYFIRST)
+    days = parsed.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]").astype(np.int64)
+    days[parsed.isna().to_numpy()] = -1
+    return days
+
+
+def trend_counts(frame: pd.DataFrame) -> collections.Counter:
+    """Count responses per day, and each ``TREND_COLUMNS`` answer per day, in a frame of rows.
+
+    Keys are ``(YYYY-MM-DD, column, value)``; the daily total uses column
+    ``"responses"`` and value ``"all"``. Counts are additive across frames.
+    """
+    counts = collections.Counter()
+    if "timestamp" not in frame.columns or frame.empty:
+        return counts
+
+    days = timestamp_days(frame["timestamp"].to_numpy(dtype=object))
+    series = [("responses", pd.Series("all", index=frame.index))]
+    series += [(col, frame[col]) for col in TREND_COLUMNS if col in frame.columns]
+    for column, values in series:
+        answers = values.astype("string").str.strip()
+        keep = (days >= 0) & answers.notna().to_numpy() & (answers != "").to_numpy()
+        grouped = pd.DataFrame({"day": days[keep], "value": answers[keep].to_numpy()}).value_counts()
+        for (day, value), count in grouped.items():
+            counts[(str(np.datetime64(int(day), "D")), column, str(value))] += int(count)
+    return counts
+
+
+def _trend_since(days: int = TREND_DAYS) -> str:
+    return str(np.datetime64("today", "D") - np.timedelta64(days, "D"))
+
+
+def trend_frame(counts) -> pd.DataFrame:
+    """Long ``(day, column, value, count)`` frame of the last ``TREND_DAYS`` from ``trend_counts`` keys."""
+    since = _trend_since()
+    frame = pd.DataFrame(
+        [(day, column, value, count) for (day, column, value), count in counts.items() if day >= since],
+        columns=["day", "column", "value", "count"],
+    )
+    frame["day"] = pd.to_datetime(frame["day"])
+    return frame.sort_values(["day", "column", "value"], ignore_index=True)
+
+
+def upsert_trend_counts(cursor, counts) -> None:
+    if counts:
+        cursor.executemany(UPSERT_TREND_SQL, [(*key, count) for key, count in counts.items()])
+
+
+def unseen_response_rows(cursor, rows) -> list:
+    """Rows whose timestamp is not stored yet (first occurrence only), found via the timestamp index."""
+    placeholders = ", ".join(["%s"] * len(rows))
+    cursor.execute(
+        f"SELECT timestamp FROM survey_responses WHERE timestamp IN ({placeholders})",
+        [row[0] for row in rows],
+    )
+    seen = {str(item[0]) for item in cursor.fetchall()}
+    unseen = []
+    for row in rows:
+        if row[0] not in seen:
+            seen.add(row[0])
+            unseen.append(row)
+    return unseen
+
+
+def backfill_trend_counts(conn, cursor) -> None:
+    """Bucket rows stored before the trend table existed; later syncs add only their new rows."""
+    if has_sync_state(cursor, TRENDS_STATE_KEY):
         return
 
-    expected_columns = [
-        "timestamp",
-        "play_frequency",
-        "platform",
-        "genres",
-        "matters_most",
-        "preference",
-        "story_importance",
-        "romance_importance",
-        "romance_engagement",
-        "romance_preference",
-        "player_gender",
-        "identity",
-        "orientation_importance",
-        "orientation",
-        "inclusive_interest",
-    ]
+    select_columns = ["id", "timestamp"] + TREND_COLUMNS
+    totals = collections.Counter()
+    last_id = 0
+    cursor.execute("DELETE FROM survey_response_trends")
+    while True:
+        cursor.execute(
+            f"SELECT {', '.join(select_columns)} FROM survey_responses WHERE id > %s ORDER BY id LIMIT %s",
+            (last_id, SYNC_BATCH_SIZE),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        totals.update(trend_counts(pd.DataFrame(rows, columns=select_columns)))
+        last_id = rows[-1][0]
 
-    source_columns = {column.lower(): column for column in sheet_df.columns}
-    normalized_rows = []
-    for _, row in sheet_df.iterrows():
-        values = []
-        for expected_col in expected_columns:
-            original_col = source_columns.get(expected_col)
-            cell_value = row[original_col] if original_col in row else None
-            values.append(None if pd.isna(cell_value) else str(cell_value))
-        normalized_rows.append(tuple(values))
-
-    conn = get_db_connection()
+    upsert_trend_counts(cursor, totals)
+    save_sync_watermark(cursor, last_id, None, TRENDS_STATE_KEY)
+    conn.commit()
+
+
+def fetch_sql_trends(cursor):
+    """Read the last ``TREND_DAYS`` of trend buckets through the table's date-leading key, once backfilled."""
+    try:
+        if not has_sync_state(cursor, TRENDS_STATE_KEY):
+            return None
+    except Exception:
+        return None
+
+    cursor.execute(
+        "SELECT bucket_date, column_name, value, responses FROM survey_response_trends WHERE bucket_date >= %s",
+        (_trend_since(),),
+    )
+    buckets = {(str(day), column, str(value)): int(count) for day, column, value, count in cursor.fetchall()}
+    return trend_frame(buckets)
+
+
+def load_sync_watermark(cursor, name: str = SYNC_STATE_KEY):
+    cursor.execute("SELECT row_index, last_timestamp FROM sync_state WHERE name = %s", (name,))
+    row = cursor.fetchone()
+    if not row:
+        return 0, None
+    return int(row[0]), row[1]
+
+
+def has_sync_state(cursor, name: str) -> bool:
+    cursor.execute("SELECT 1 FROM sync_state WHERE name = %s", (name,))
+    return cursor.fetchone() is not None
+
+
+def save_sync_watermark(cursor, row_index: int, last_timestamp, name: str = SYNC_STATE_KEY) -> None:
+    cursor.execute(
+        """
+        INSERT INTO sync_state (name, row_index, last_timestamp, updated_at)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            row_index = VALUES(row_index),
+            last_timestamp = VALUES(last_timestamp),
+            updated_at = VALUES(updated_at)
+        """,
+        (name, row_index, last_timestamp, time.time()),
+    )
+
+
+def dataframe_to_response_rows(df: pd.DataFrame):
+    """Convert a normalized frame to insert tuples column by column (missing cells become None)."""
+    source_columns = {column.lower(): column for column in df.columns}
+    columns = []
+    for expected_col in RESPONSE_COLUMNS:
+        original_col = source_columns.get(expected_col)
+        if original_col is None:
+            columns.append(np.full(len(df), None, dtype=object))
+            continue
+        series = df[original_col]
+        values = series.astype(str).to_numpy(dtype=object)
+        values[series.isna().to_numpy()] = None
+        columns.append(values)
+    return list(zip(*columns))
+
+
+@timed("sync_google_sheet_to_mysql")
+def sync_google_sheet_to_mysql() -> int:
+    """Copy sheet rows past the persisted high-water mark into MySQL.
+
+    Returns the number of rows inserted during this cycle. The cadence is up to
+    the caller; the background scheduler runs it every SYNC_INTERVAL_SECONDS.
+    """
+    if not SYNC_FROM_GOOGLE_SHEETS:
+        return 0
+
+    with db_pool.connection() as conn:
+        ensure_sync_schema(conn)
+        inserted = _sync_pending_rows(conn)
+        if inserted and aggregate_store.source == "sql":
+            aggregate_store.refresh_from_sql(conn)
+
+    rows_synced.inc(inserted)
+    logger.info("Google Sheets sync inserted %d new rows", inserted)
+    return inserted
+
+
+def _sync_pending_rows(conn) -> int:
     cursor = conn.cursor()
+    inserted = 0
     try:
-        cursor.execute("SELECT timestamp FROM survey_responses")
-        existing_timestamps = {str(item[0]) for item in cursor.fetchall() if item[0] is not None}
-
-        rows_to_insert = [row for row in normalized_rows if row[0] and row[0] not in existing_timestamps]
-        if rows_to_insert:
-            insert_sql = """
-                INSERT INTO survey_responses (
-                    timestamp, play_frequency, platform, genres, matters_most, preference,
-                    story_importance, romance_importance, romance_engagement, romance_preference,
-                    player_gender, identity, orientation_importance, orientation, inclusive_interest
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.executemany(insert_sql, rows_to_insert)
+        row_index, last_timestamp = load_sync_watermark(cursor)
+
+        # Read from the boundary row so it can be checked against the watermark.
+        # If the sheet is now shorter, or that row no longer carries the recorded
+        # timestamp, rows were edited or removed upstream; replaying from the top
+        # is safe because inserts are idempotent.
+        boundary = max(row_index - 1, 0)
+        sheet_df = normalize_dataframe_columns(sheets_reader.read(boundary))
+        replay = row_index > sheets_reader.row_count
+        if not replay and row_index > 0 and last_timestamp is not None and "timestamp" in sheet_df.columns:
+            replay = str(sheet_df["timestamp"].get(boundary)) != last_timestamp
+        if replay:
+            row_index = 0
+            if sheet_df.index.start != 0:
+                sheet_df = normalize_dataframe_columns(sheets_reader.read(0))
+
+        # Without the unique key, INSERT IGNORE cannot dedupe a replay, so fall back
+        # to the legacy timestamp scan for that one pass.
+        existing_timestamps = set()
+        if row_index == 0 and not _sync_unique_key_ready:
+            cursor.execute("SELECT timestamp FROM survey_responses")
+            existing_timestamps = {str(item[0]) for item in cursor.fetchall() if item[0] is not None}
+
+        pending = dataframe_to_response_rows(sheet_df.loc[row_index:])
+        for start in range(0, len(pending), SYNC_BATCH_SIZE):
+            chunk = pending[start : start + SYNC_BATCH_SIZE]
+            rows_to_insert = [row for row in chunk if row[0] and row[0] not in existing_timestamps]
+            if rows_to_insert:
+                new_rows = unseen_response_rows(cursor, rows_to_insert)
+                cursor.executemany(INSERT_RESPONSE_SQL, rows_to_insert)
+                inserted += max(cursor.rowcount, 0)
+                insert_response_options(cursor, new_rows)
+                upsert_trend_counts(cursor, trend_counts(pd.DataFrame(new_rows, columns=RESPONSE_COLUMNS)))
+            save_sync_watermark(cursor, row_index + start + len(chunk), chunk[-1][0])
             conn.commit()
     finally:
         cursor.close()
-        conn.close()
+    return inserted
+
+
+DASHBOARD_DROP_COLUMNS = {"timestamp", "marca temporal", "id"}
+
+PAIRED_CHARTS = [
+    ("identity", "player_gender"),
+    ("orientation", "orientation_importance"),
+]
+
+
+class SurveyAggregates:
+    """Compact counts the dashboard is drawn from.
+
+    ``value_counts`` maps each plottable column to a Series of counts indexed by
+    the raw answer (NaN for missing answers); ``option_counts`` holds the
+    already-split counts of multiselect columns; ``crosstabs`` maps each pair in
+    ``PAIRED_CHARTS`` to a long frame of ``(x, color, count)`` rows;
+    ``associations`` is the optional Cramér's V matrix between columns and
+    ``trends`` the optional long frame of daily counts from ``trend_counts``.
+    """
+
+    def __init__(
+        self,
+        row_count: int,
+        value_counts: dict,
+        crosstabs: dict,
+        option_counts: dict = None,
+        associations=None,
+        trends=None,
+    ):
+        self.row_count = row_count
+        self.value_counts = value_counts
+        self.crosstabs = crosstabs
+        self.option_counts = option_counts or {}
+        self.associations = associations
+        self.trends = trends
+
+    @property
+    def columns(self):
+        return list(self.value_counts)
+
+    def fingerprint(self) -> str:
+        """Content hash used as the dashboard data version; equal data gives equal versions."""
+        return content_fingerprint(
+            self.row_count,
+            *[(col, counts) for col, counts in sorted(self.value_counts.items())],
+            *[(col, counts) for col, counts in sorted(self.option_counts.items())],
+            *[(pair, frame) for pair, frame in sorted(self.crosstabs.items())],
+        )
+
+
+def _plottable_columns(columns):
+    return [column for column in columns if column.lower() not in DASHBOARD_DROP_COLUMNS]
+
+
+def _grow(buffer: np.ndarray, used: int, needed: int, fill) -> np.ndarray:
+    """Return ``buffer`` with room for ``needed`` entries, doubling capacity when full."""
+    if len(buffer) >= needed:
+        return buffer
+    grown = np.full(max(needed, 2 * len(buffer), 1024), fill, dtype=buffer.dtype)
+    grown[:used] = buffer[:used]
+    return grown
+
+
+def _pad(counts: np.ndarray, shape) -> np.ndarray:
+    if counts.shape == tuple(shape):
+        return counts
+    padded = np.zeros(shape, dtype=np.int64)
+    padded[tuple(slice(0, size) for size in counts.shape)] = counts
+    return padded
+
+
+class EncodedResponses:
+    """Survey responses as dictionary-encoded columns.
+
+    Every plottable column is an int32 code array into a per-column vocabulary
+    (code -1 marks a missing answer). Multiselect columns additionally keep one
+    ``(row, option code)`` entry per selected option. Value, option and paired
+    counts are maintained with ``np.bincount`` over each appended chunk, so
+    ``aggregates()`` costs O(distinct values).
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        self.vocabulary = {}
+        self.option_vocabulary = {}
+        self._codes = {}
+        self._lookup = {}
+        self._counts = {}
+        self._missing = {}
+        self._option_lookup = {}
+        self._option_rows = {}
+        self._option_codes = {}
+        self._option_used = {}
+        self._option_counts = {}
+        self._crosstabs = {}
+        self._trends = collections.Counter()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "EncodedResponses":
+        responses = cls()
+        responses.append(df)
+        return responses
+
+    @property
+    def columns(self):
+        return list(self.vocabulary)
+
+    def codes(self, col: str) -> np.ndarray:
+        return self._codes[col][: self.row_count]
+
+    def option_entries(self, col: str):
+        """Return ``(rows, option_codes)`` arrays for a multiselect column."""
+        used = self._option_used[col]
+        return self._option_rows[col][:used], self._option_codes[col][:used]
+
+    def _encode(self, lookup: dict, vocabulary: list, values) -> np.ndarray:
+        chunk_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        remap = np.empty(len(uniques), dtype=np.int32)
+        for position, value in enumerate(uniques):
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(vocabulary)
+                vocabulary.append(value)
+            remap[position] = code
+        codes = np.full(len(chunk_codes), -1, dtype=np.int32)
+        present = chunk_codes >= 0
+        codes[present] = remap[chunk_codes[present]]
+        return codes
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Encode a chunk of normalized rows and fold it into the running counts."""
+        start, added = self.row_count, len(df)
+        if added == 0:
+            return
+        end = start + added
+        self._trends.update(trend_counts(df))
+
+        for col in _plottable_columns(df.columns):
+            vocabulary = self.vocabulary.setdefault(col, [])
+            new_codes = self._encode(self._lookup.setdefault(col, {}), vocabulary, df[col].to_numpy(dtype=object))
+            buffer = _grow(self._codes.get(col, np.empty(0, dtype=np.int32)), start, end, -1)
+            buffer[start:end] = new_codes
+            self._codes[col] = buffer
+            present = new_codes[new_codes >= 0]
+            self._counts[col] = _pad(self._counts.get(col, np.zeros(0, np.int64)), (len(vocabulary),))
+            self._counts[col] += np.bincount(present, minlength=len(vocabulary))
+            self._missing[col] = self._missing.get(col, 0) + int(added - len(present))
+
+            if is_multiselect_column(col):
+                self._append_options(col, df[col], start)
+
+        for col in list(self._codes):
+            if col not in df.columns:
+                self._codes[col] = _grow(self._codes[col], start, end, -1)
+                self._codes[col][start:end] = -1
+                self._missing[col] += added
+
+        self.row_count = end
+
+        for x_col, color_col in PAIRED_CHARTS:
+            if x_col not in self._codes or color_col not in self._codes:
+                continue
+            x_codes = self._codes[x_col][start:end]
+            color_codes = self._codes[color_col][start:end]
+            shape = (len(self.vocabulary[x_col]), len(self.vocabulary[color_col]))
+            both = (x_codes >= 0) & (color_codes >= 0)
+            cells = np.bincount(
+                x_codes[both].astype(np.int64) * shape[1] + color_codes[both],
+                minlength=shape[0] * shape[1],
+            ).reshape(shape)
+            existing = self._crosstabs.get((x_col, color_col))
+            self._crosstabs[(x_col, color_col)] = cells if existing is None else _pad(existing, shape) + cells
+
+    def _append_options(self, col: str, values: pd.Series, start: int) -> None:
+        pairs = split_multiselect(values)
+
+        vocabulary = self.option_vocabulary.setdefault(col, [])
+        option_codes = self._encode(self._option_lookup.setdefault(col, {}), vocabulary, pairs["value"].to_numpy())
+        used = self._option_used.get(col, 0)
+        needed = used + len(pairs)
+        self._option_rows[col] = _grow(self._option_rows.get(col, np.empty(0, np.int32)), used, needed, 0)
+        self._option_codes[col] = _grow(self._option_codes.get(col, np.empty(0, np.int32)), used, needed, 0)
+        self._option_rows[col][used:needed] = pairs["row"].to_numpy(dtype=np.int32) + start
+        self._option_codes[col][used:needed] = option_codes
+        self._option_used[col] = needed
+        self._option_counts[col] = _pad(self._option_counts.get(col, np.zeros(0, np.int64)), (len(vocabulary),))
+        self._option_counts[col] += np.bincount(option_codes, minlength=len(vocabulary))
+
+    def aggregates(self) -> SurveyAggregates:
+        aggregates = aggregates_from_code_counts(
+            self.row_count,
+            self.vocabulary,
+            self._counts,
+            self._missing,
+            self.option_vocabulary,
+            self._option_counts,
+            self._crosstabs,
+        )
+        aggregates.trends = trend_frame(self._trends)
+        return aggregates
+
+    def nbytes(self) -> int:
+        arrays = list(self._codes.values()) + list(self._option_rows.values()) + list(self._option_codes.values())
+        return int(sum(array.nbytes for array in arrays))
+
+    def save(self, directory: str) -> None:
+        """Write every array as a .npy file plus a JSON manifest of vocabularies."""
+        os.makedirs(directory, exist_ok=True)
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "row_count": self.row_count,
+            "columns": [],
+            "options": [],
+            "crosstabs": [],
+            "trends": [[*key, count] for key, count in self._trends.items()],
+        }
+        for position, (col, vocabulary) in enumerate(self.vocabulary.items()):
+            np.save(os.path.join(directory, f"codes_{position}.npy"), self.codes(col))
+            np.save(os.path.join(directory, f"counts_{position}.npy"), self._counts[col])
+            manifest["columns"].append({"name": col, "vocabulary": vocabulary, "missing": self._missing[col]})
+        for position, (col, vocabulary) in enumerate(self.option_vocabulary.items()):
+            rows, codes = self.option_entries(col)
+            np.save(os.path.join(directory, f"option_rows_{position}.npy"), rows)
+            np.save(os.path.join(directory, f"option_codes_{position}.npy"), codes)
+            np.save(os.path.join(directory, f"option_counts_{position}.npy"), self._option_counts[col])
+            manifest["options"].append({"name": col, "vocabulary": vocabulary})
+        for position, (pair, cells) in enumerate(self._crosstabs.items()):
+            np.save(os.path.join(directory, f"crosstab_{position}.npy"), cells)
+            manifest["crosstabs"].append(list(pair))
+        with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, default=str)
+
+    @classmethod
+    def load(cls, directory: str) -> "EncodedResponses":
+        """Load a saved model with the per-row arrays memory-mapped read-only.
+
+        Appending later copies a column into a fresh buffer, so the mapped files
+        are never written to.
+        """
+        with open(os.path.join(directory, "manifest.json"), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Snapshot format {manifest.get('format')} is not {SNAPSHOT_FORMAT}")
+
+        def array(name: str, mmap: bool = False) -> np.ndarray:
+            return np.load(os.path.join(directory, name), mmap_mode="r" if mmap else None)
+
+        responses = cls()
+        responses.row_count = manifest["row_count"]
+        responses._trends.update({(day, column, value): count for day, column, value, count in manifest["trends"]})
+        for position, column in enumerate(manifest["columns"]):
+            col = column["name"]
+            responses.vocabulary[col] = column["vocabulary"]
+            responses._lookup[col] = {value: code for code, value in enumerate(column["vocabulary"])}
+            responses._codes[col] = array(f"codes_{position}.npy", mmap=True)
+            responses._counts[col] = array(f"counts_{position}.npy")
+            responses._missing[col] = column["missing"]
+        for position, option in enumerate(manifest["options"]):
+            col = option["name"]
+            responses.option_vocabulary[col] = option["vocabulary"]
+            responses._option_lookup[col] = {value: code for code, value in enumerate(option["vocabulary"])}
+            responses._option_rows[col] = array(f"option_rows_{position}.npy", mmap=True)
+            responses._option_codes[col] = array(f"option_codes_{position}.npy", mmap=True)
+            responses._option_used[col] = len(responses._option_rows[col])
+            responses._option_counts[col] = array(f"option_counts_{position}.npy")
+        for position, pair in enumerate(manifest["crosstabs"]):
+            responses._crosstabs[tuple(pair)] = array(f"crosstab_{position}.npy")
+        return responses
+
+
+def aggregates_from_code_counts(
+    row_count: int,
+    vocabulary: dict,
+    counts: dict,
+    missing: dict,
+    option_vocabulary: dict,
+    option_counts: dict,
+    crosstabs: dict,
+) -> SurveyAggregates:
+    """Turn per-code count arrays back into the labelled Series and frames the charts use."""
+    value_counts = {}
+    for col, values in vocabulary.items():
+        nonzero = np.flatnonzero(counts[col])
+        index = [values[code] for code in nonzero]
+        column_counts = counts[col][nonzero].tolist()
+        if missing[col]:
+            index.append(float("nan"))
+            column_counts.append(missing[col])
+        value_counts[col] = pd.Series(column_counts, index=pd.Index(index, dtype=object), name="count", dtype="int64")
+
+    options = {
+        col: pd.Series(option_counts[col], index=[str(value) for value in values], dtype="int64")
+        for col, values in option_vocabulary.items()
+    }
+
+    frames = {}
+    for (x_col, color_col), cells in crosstabs.items():
+        x_codes, color_codes = np.nonzero(cells)
+        frames[(x_col, color_col)] = pd.DataFrame(
+            {
+                x_col: [vocabulary[x_col][code] for code in x_codes],
+                color_col: [vocabulary[color_col][code] for code in color_codes],
+                "count": cells[x_codes, color_codes],
+            }
+        )
+    return SurveyAggregates(row_count, value_counts, frames, options)
+
+
+class BitmapIndex:
+    """Packed row bitmaps per (column, value) over an ``EncodedResponses``, for cross-filtering.
+
+    Each column holds a ``(values + 1, words)`` uint64 matrix: one row of bits
+    per vocabulary code and a last row for missing answers. Multiselect columns
+    also get one row per option, so a filter on a single genre is one bitmap.
+    Filtered counts are an AND with the filter mask plus ``np.bitwise_count``.
+    Columns with more than ``CROSS_FILTER_MAX_VALUES`` values are not indexed;
+    their filtered counts fall back to a bincount over the unpacked mask.
+    """
+
+    def __init__(self, responses: EncodedResponses):
+        self.row_count = responses.row_count
+        self.words = max(1, -(-self.row_count // 64))
+        self.vocabulary = {col: list(values) for col, values in responses.vocabulary.items()}
+        self.option_vocabulary = {col: list(values) for col, values in responses.option_vocabulary.items()}
+        self._all = self._pack(iter([np.ones(self.row_count, dtype=bool)]), 1)[0]
+        self._values = {}
+        self._unindexed = {}
+        self._labels = {}
+        for col, values in self.vocabulary.items():
+            codes = responses.codes(col)
+            if len(values) > CROSS_FILTER_MAX_VALUES:
+                self._unindexed[col] = codes
+                continue
+            self._values[col] = self._pack((codes == code for code in [*range(len(values)), -1]), len(values) + 1)
+            self._labels[col] = {str(value): code for code, value in enumerate(values)}
+
+        self._options = {}
+        self._option_labels = {}
+        for col, values in self.option_vocabulary.items():
+            rows, option_codes = responses.option_entries(col)
+            self._options[col] = self._pack(
+                (self._row_mask(rows[option_codes == code]) for code in range(len(values))), len(values)
+            )
+            self._option_labels[col] = {str(value): code for code, value in enumerate(values)}
+
+        self._pairs = [pair for pair in responses._crosstabs if pair[0] in self._values and pair[1] in self._values]
+        self._filtered = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _row_mask(self, rows: np.ndarray) -> np.ndarray:
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def _pack(self, masks, count: int) -> np.ndarray:
+        packed = np.zeros((count, self.words * 8), dtype=np.uint8)
+        for position, mask in enumerate(masks):
+            row = np.packbits(mask, bitorder="little")
+            packed[position, : len(row)] = row
+        return packed.view(np.uint64)
+
+    @staticmethod
+    def _popcounts(bitmaps: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(bitmaps & mask).sum(axis=-1, dtype=np.int64)
+
+    def nbytes(self) -> int:
+        return int(sum(bitmaps.nbytes for bitmaps in [*self._values.values(), *self._options.values()]))
+
+    def bitmap(self, col: str, label: str):
+        """Return the row bitmap for a chart label (``"Missing"`` for blanks), or None."""
+        if col in self._options:
+            code = self._option_labels[col].get(label)
+            return None if code is None else self._options[col][code]
+        if col not in self._values:
+            return None
+        code = self._labels[col].get(label)
+        if code is None:
+            return self._values[col][-1] if label == "Missing" else None
+        return self._values[col][code]
+
+    def filter_mask(self, filters: dict) -> np.ndarray:
+        """AND of the bitmaps for every ``column -> label`` filter; unknown labels are ignored."""
+        mask = self._all.copy()
+        for col, label in filters.items():
+            bitmap = self.bitmap(col, label)
+            if bitmap is not None:
+                np.bitwise_and(mask, bitmap, out=mask)
+        return mask
+
+    def count(self, filters: dict) -> int:
+        return int(np.bitwise_count(self.filter_mask(filters)).sum())
+
+    def filtered_aggregates(self, filters: dict) -> SurveyAggregates:
+        """Aggregates restricted to the rows matching every filter, memoized per filter set."""
+        key = tuple(sorted(filters.items()))
+        with self._lock:
+            if key in self._filtered:
+                self._filtered.move_to_end(key)
+                return self._filtered[key]
+
+        mask = self.filter_mask(filters)
+        counts = {}
+        missing = {}
+        for col, bitmaps in self._values.items():
+            hits = self._popcounts(bitmaps, mask)
+            counts[col], missing[col] = hits[:-1], int(hits[-1])
+        if self._unindexed:
+            selected = np.unpackbits(mask.view(np.uint8), count=self.row_count, bitorder="little").astype(bool)
+            for col, codes in self._unindexed.items():
+                chosen = codes[selected]
+                present = chosen[chosen >= 0]
+                counts[col] = np.bincount(present, minlength=len(self.vocabulary[col]))
+                missing[col] = int(len(chosen) - len(present))
+
+        option_counts = {col: self._popcounts(bitmaps, mask) for col, bitmaps in self._options.items()}
+        crosstabs = {}
+        for x_col, color_col in self._pairs:
+            colors = self._values[color_col][:-1] & mask
+            crosstabs[(x_col, color_col)] = np.stack(
+                [self._popcounts(colors, row) for row in self._values[x_col][:-1]]
+            ).reshape(len(self.vocabulary[x_col]), len(self.vocabulary[color_col]))
+
+        aggregates = aggregates_from_code_counts(
+            int(np.bitwise_count(mask).sum()),
+            {col: self.vocabulary[col] for col in counts},
+            counts,
+            missing,
+            self.option_vocabulary,
+            option_counts,
+            crosstabs,
+        )
+        with self._lock:
+            self._filtered[key] = aggregates
+            while len(self._filtered) > 32:
+                self._filtered.popitem(last=False)
+        return aggregates
+
+
+class AssociationTables:
+    """Running contingency tables for every pair of columns with at most ``ASSOCIATION_MAX_VALUES`` answers.
+
+    All pairs are counted together: per chunk of rows, one ``np.bincount`` over
+    ``pair * k * k + left * k + right`` (k being the largest vocabulary, rows
+    missing either answer going to a spill bin). The tables are additive, so
+    ``update`` only counts rows appended since the last call.
+    """
+
+    def __init__(self, responses: EncodedResponses):
+        self.responses = responses
+        self.columns = self.eligible_columns(responses)
+        self.k = max((len(responses.vocabulary[col]) for col in self.columns), default=0)
+        self.left, self.right = np.triu_indices(len(self.columns), k=1)
+        self.rows = 0
+        self._spill = len(self.left) * self.k * self.k
+        self._tables = np.zeros(self._spill + 1, dtype=np.int64)
+
+    @staticmethod
+    def eligible_columns(responses: EncodedResponses) -> list:
+        return [col for col, values in responses.vocabulary.items() if 1 < len(values) <= ASSOCIATION_MAX_VALUES]
+
+    def covers(self, responses: EncodedResponses) -> bool:
+        """True while new rows can be folded in without re-laying out the tables."""
+        return (
+            responses is self.responses
+            and self.eligible_columns(responses) == self.columns
+            and all(len(responses.vocabulary[col]) <= self.k for col in self.columns)
+        )
+
+    def update(self, chunk_rows: int = 16384) -> None:
+        offsets = (np.arange(len(self.left), dtype=np.int32) * self.k * self.k)[:, None]
+        for start in range(self.rows, self.responses.row_count, chunk_rows):
+            stop = min(start + chunk_rows, self.responses.row_count)
+            codes = np.stack([self.responses.codes(col)[start:stop] for col in self.columns])
+            left_codes, right_codes = codes[self.left], codes[self.right]
+            cells = offsets + left_codes * self.k + right_codes
+            cells[(left_codes < 0) | (right_codes < 0)] = self._spill
+            self._tables += np.bincount(cells.ravel(), minlength=self._spill + 1)
+        self.rows = self.responses.row_count
+
+    def cramers_v(self):
+        """Chi-square and Cramér's V for all stacked ``(pairs, k, k)`` tables at once, as a column matrix."""
+        if len(self.columns) < 2:
+            return None
+        observed = self._tables[: self._spill].reshape(len(self.left), self.k, self.k).astype(float)
+        total = observed.sum(axis=(1, 2))
+        row_totals, column_totals = observed.sum(axis=2), observed.sum(axis=1)
+        expected = row_totals[:, :, None] * column_totals[:, None, :] / np.maximum(total, 1)[:, None, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chi_square = np.where(expected > 0, (observed - expected) ** 2 / expected, 0.0).sum(axis=(1, 2))
+            dof = np.minimum((row_totals > 0).sum(axis=1), (column_totals > 0).sum(axis=1)) - 1
+            cramers_v = np.where((total > 0) & (dof > 0), np.sqrt(chi_square / (total * dof)), np.nan)
+
+        matrix = np.eye(len(self.columns))
+        matrix[self.left, self.right] = cramers_v
+        matrix[self.right, self.left] = cramers_v
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+
+def association_matrix(responses: EncodedResponses) -> pd.DataFrame:
+    """Cramér's V between every pair of low-cardinality columns, counted from scratch."""
+    tables = AssociationTables(responses)
+    tables.update()
+    return tables.cramers_v()
+
+
+def _quote_identifier(name: str) -> str:
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def fetch_sql_aggregates(conn, up_to_id=None) -> SurveyAggregates:
+    """Run one GROUP BY per charted column and crosstab; no raw rows leave MySQL.
+
+    ``up_to_id`` restricts every query to ``id <= up_to_id`` so the result lines
+    up with a known position in the table.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT * FROM survey_responses LIMIT 0")
+        actual_columns = [description[0] for description in cursor.description]
+        cursor.fetchall()
+        canonical = normalize_dataframe_columns(pd.DataFrame(columns=actual_columns)).columns
+        actual_by_canonical = dict(zip(canonical, actual_columns))
+
+        conditions, params = [], ()
+        if up_to_id is not None:
+            conditions, params = ["id <= %s"], (up_to_id,)
+
+        def where(*extra):
+            clauses = conditions + list(extra)
+            return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        cursor.execute("SELECT COUNT(*) FROM survey_responses" + where(), params)
+        row_count = int(cursor.fetchone()[0])
+
+        value_counts = {}
+        for col in _plottable_columns(canonical):
+            column_sql = _quote_identifier(actual_by_canonical[col])
+            cursor.execute(
+                f"SELECT {column_sql}, COUNT(*) FROM survey_responses{where()} GROUP BY {column_sql}",
+                params,
+            )
+            rows = cursor.fetchall()
+            value_counts[col] = pd.Series(
+                [int(count) for _, count in rows],
+                index=pd.Index([value for value, _ in rows], dtype=object),
+                name="count",
+                dtype="int64",
+            )
+
+        crosstabs = {}
+        for x_col, color_col in PAIRED_CHARTS:
+            if x_col not in actual_by_canonical or color_col not in actual_by_canonical:
+                continue
+            x_sql = _quote_identifier(actual_by_canonical[x_col])
+            color_sql = _quote_identifier(actual_by_canonical[color_col])
+            cursor.execute(
+                f"SELECT {x_sql}, {color_sql}, COUNT(*) FROM survey_responses"
+                f"{where(f'{x_sql} IS NOT NULL', f'{color_sql} IS NOT NULL')} "
+                f"GROUP BY {x_sql}, {color_sql}",
+                params,
+            )
+            crosstabs[(x_col, color_col)] = pd.DataFrame(
+                cursor.fetchall(), columns=[x_col, color_col, "count"]
+            )
+
+        option_counts = fetch_sql_option_counts(cursor, up_to_id)
+    finally:
+        cursor.close()
+
+    for col, counts in value_counts.items():
+        if col not in option_counts and is_multiselect_column(col):
+            option_counts[col] = split_multiselect_counts(counts)
+    return SurveyAggregates(row_count, value_counts, crosstabs, option_counts)
+
+
+def fetch_sql_option_counts(cursor, up_to_id=None) -> dict:
+    """Read multiselect option counts from the indexed bridge table, once it is backfilled."""
+    try:
+        if not has_sync_state(cursor, OPTIONS_STATE_KEY):
+            return {}
+    except Exception:
+        return {}
+
+    if up_to_id is None:
+        cursor.execute(
+            "SELECT column_name, value, COUNT(*) FROM survey_response_options GROUP BY column_name, value"
+        )
+    else:
+        cursor.execute(
+            "SELECT column_name, value, COUNT(*) FROM survey_response_options "
+            "WHERE response_id <= %s GROUP BY column_name, value",
+            (up_to_id,),
+        )
+    grouped = {}
+    for column, value, count in cursor.fetchall():
+        grouped.setdefault(column, {})[str(value)] = int(count)
+    return {column: pd.Series(counts, dtype="int64") for column, counts in grouped.items()}
 
-    _last_sync_epoch = current_time
 
+def stream_survey_responses(conn, where_sql: str = "", params=(), chunk_rows: int = None):
+    """Yield normalized response frames of at most ``chunk_rows`` rows, ordered by id.
 
-def fetch_data(force_fallback: bool = False) -> pd.DataFrame:
-    def fetch_from_sql() -> pd.DataFrame:
-        conn = get_db_connection()
+    Rows are pulled with ``fetchmany`` from an unbuffered cursor, so only one
+    chunk is ever materialized on the client.
+    """
+    chunk_rows = chunk_rows or SQL_STREAM_CHUNK_ROWS
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT * FROM survey_responses{where_sql} ORDER BY id", params)
+        columns = [description[0] for description in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield normalize_dataframe_columns(pd.DataFrame.from_records(rows, columns=columns))
+    finally:
+        cursor.close()
+
+
+@contextmanager
+def track_peak_memory(enabled: bool):
+    """Record the peak traced allocation of the block into the yielded dict."""
+    stats = {"peak_bytes": None}
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    if enabled:
+        tracemalloc.reset_peak()
+    try:
+        yield stats
+    finally:
+        if enabled:
+            stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        if started:
+            tracemalloc.stop()
+
+
+class AggregateStore:
+    """The resident, dictionary-encoded response set the dashboard is drawn from.
+
+    New rows are encoded and folded in as deltas (``apply_rows``), so keeping the
+    dashboard current costs O(new rows). ``rebuild_from_sql`` reloads the rows to
+    seed the store; every ``AGGREGATE_VERIFY_SECONDS`` the running counts are
+    checked against GROUP BY queries and reloaded if they drifted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._update_lock = threading.Lock()
+        self.source = None
+        self.position = 0
+        self.rebuilt_at = 0.0
+        self.version = 0
+        self.responses = EncodedResponses()
+        self.last_rebuild_stats = {}
+        self._bitmaps = None
+        self._associations = None
+        self._association_tables = None
+        self._sheets_generation = None
+
+    @property
+    def ready(self) -> bool:
+        return self.source is not None
+
+    def _replace(self, responses: EncodedResponses, source: str, position: int) -> None:
+        with self._lock:
+            self.responses = responses
+            self.source = source
+            self.position = position
+            self.rebuilt_at = time.time()
+            self.version += 1
+
+    def save_snapshot(self, root: str, data_version: str) -> None:
+        """Persist the store under ``root`` and point ``root/CURRENT`` at it."""
+        target = os.path.join(root, f"snapshot-{int(time.time() * 1000)}-{os.getpid()}")
+        with self._lock:
+            self.responses.save(target)
+            meta = {
+                "data_version": data_version,
+                "source": self.source,
+                "position": self.position,
+                "saved_at": time.time(),
+            }
+        with open(os.path.join(target, "store.json"), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+        pointer = os.path.join(root, "CURRENT")
+        with open(f"{pointer}.{os.getpid()}", "w", encoding="utf-8") as file:
+            file.write(os.path.basename(target))
+        os.replace(f"{pointer}.{os.getpid()}", pointer)
+
+        for name in os.listdir(root):
+            if name.startswith("snapshot-") and name != os.path.basename(target):
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+    def load_snapshot(self, root: str):
+        """Memory-map the snapshot ``root/CURRENT`` points at; returns its metadata or None."""
+        pointer = os.path.join(root, "CURRENT")
+        if not os.path.exists(pointer):
+            return None
+        with open(pointer, "r", encoding="utf-8") as file:
+            directory = os.path.join(root, file.read().strip())
+        with open(os.path.join(directory, "store.json"), "r", encoding="utf-8") as file:
+            meta = json.load(file)
+
+        self._replace(EncodedResponses.load(directory), meta["source"], meta["position"])
+        self.rebuilt_at = meta["saved_at"]
+        return meta
+
+    def apply_rows(self, df: pd.DataFrame, position: int) -> None:
+        """Encode newly arrived (normalized) rows into the store and advance to ``position``."""
+        with self._lock:
+            self.responses.append(df)
+            self.position = position
+            if len(df):
+                self.version += 1
+
+    def snapshot(self) -> SurveyAggregates:
+        with self._lock:
+            aggregates = self.responses.aggregates()
+            aggregates.associations = self._association_matrix()
+            return aggregates
+
+    def _association_matrix(self):
+        """Cramér's V matrix for the current version; appended rows are counted incrementally."""
+        if self._associations is None or self._associations[0] != self.version:
+            if self._association_tables is None or not self._association_tables.covers(self.responses):
+                self._association_tables = AssociationTables(self.responses)
+            self._association_tables.update()
+            self._associations = (self.version, self._association_tables.cramers_v())
+        return self._associations[1]
+
+    def bitmap_index(self):
+        """The latest cross-filter index, or None until ``update_bitmap_index`` has built one."""
+        bitmaps = self._bitmaps
+        return None if bitmaps is None else bitmaps[1]
+
+    @timed("bitmap_index")
+    def update_bitmap_index(self) -> None:
+        """Rebuild the cross-filter index if the data changed since the last build.
+
+        Runs in the refresh job, not in callbacks. It holds only the update lock,
+        so readers keep the previous index while the new one is built.
+        """
+        with self._update_lock:
+            if not self.ready or (self._bitmaps is not None and self._bitmaps[0] == self.version):
+                return
+            self._bitmaps = (self.version, BitmapIndex(self.responses))
+
+    def rebuild_from_sql(self, conn) -> None:
+        cursor = conn.cursor()
         try:
-            return normalize_dataframe_columns(pd.read_sql("SELECT * FROM survey_responses", conn))
+            cursor.execute("SELECT MAX(id) FROM survey_responses")
+            max_id = int(cursor.fetchone()[0] or 0)
         finally:
-            conn.close()
+            cursor.close()
+
+        started = time.perf_counter()
+        responses = EncodedResponses()
+        chunks = 0
+        with track_peak_memory(SQL_STREAM_TRACE_MEMORY) as memory:
+            for chunk in stream_survey_responses(conn, " WHERE id <= %s", (max_id,)):
+                responses.append(chunk)
+                chunks += 1
+        self._replace(responses, "sql", max_id)
+
+        self.last_rebuild_stats = {
+            "rows": responses.row_count,
+            "chunks": chunks,
+            "seconds": round(time.perf_counter() - started, 3),
+            "encoded_bytes": responses.nbytes(),
+            "peak_bytes": memory["peak_bytes"],
+        }
+        logger.info("Aggregate store rebuilt from SQL: %s", self.last_rebuild_stats)
+
+    def verify_against_sql(self, conn) -> bool:
+        """Compare the running counts with GROUP BY results; reload the rows on drift.
+
+        Genre options are checked against ``survey_response_options`` and the
+        paired charts against their two-column GROUP BY, not just per-column counts.
+        """
+        matches = _aggregates_equal(self.snapshot(), fetch_sql_aggregates(conn, up_to_id=self.position))
+        if matches:
+            self.rebuilt_at = time.time()
+        else:
+            logger.warning("Aggregate store drifted from SQL; reloading responses")
+            self.rebuild_from_sql(conn)
+        return matches
+
+    @timed("store_refresh_from_sql")
+    def refresh_from_sql(self, conn) -> None:
+        with self._update_lock:
+            if self.source != "sql":
+                self.rebuild_from_sql(conn)
+                return
+
+            for chunk in stream_survey_responses(conn, " WHERE id > %s", (self.position,)):
+                self.apply_rows(chunk, int(chunk["id"].max()))
+            if time.time() - self.rebuilt_at >= AGGREGATE_VERIFY_SECONDS:
+                self.verify_against_sql(conn)
+
+    @timed("store_refresh_from_sheets")
+    def refresh_from_sheets(self, reader: SheetsReader) -> None:
+        with self._update_lock:
+            start = self.position if self.source == "sheets" else 0
+            df = reader.read(start)
+            # The sheet was re-read in full since the store last read it, by this
+            # call or by another reader caller such as the sync: rows before our
+            # position may have changed, so re-encode from row 0.
+            if self.source != "sheets" or df.attrs["generation"] != self._sheets_generation:
+                if df.index.start != 0:
+                    df = reader.read(0)
+                self._replace(EncodedResponses.from_frame(normalize_dataframe_columns(df)), "sheets", df.index.stop)
+            elif len(df):
+                self.apply_rows(normalize_dataframe_columns(df), df.index.stop)
+            self._sheets_generation = df.attrs["generation"]
+
+
+def _labelled_counts(counts: pd.Series) -> pd.Series:
+    counts = display_counts(counts)
+    return counts[counts != 0].sort_index()
+
+
+def _crosstab_counts(frame: pd.DataFrame) -> pd.Series:
+    if frame.empty:
+        return pd.Series(dtype="int64")
+    labels = pd.MultiIndex.from_arrays([frame.iloc[:, 0].astype(str), frame.iloc[:, 1].astype(str)])
+    counts = pd.Series(frame["count"].to_numpy(dtype="int64"), index=labels).groupby(level=[0, 1]).sum()
+    return counts[counts != 0].sort_index()
+
+
+def _aggregates_equal(left: SurveyAggregates, right: SurveyAggregates) -> bool:
+    """True when row, value, multiselect option and paired counts all match."""
+    if left.row_count != right.row_count or set(left.value_counts) != set(right.value_counts):
+        return False
+    for col in left.value_counts:
+        if not _labelled_counts(left.value_counts[col]).equals(_labelled_counts(right.value_counts[col])):
+            return False
+    if set(left.option_counts) != set(right.option_counts):
+        return False
+    for col in left.option_counts:
+        if not _labelled_counts(left.option_counts[col]).equals(_labelled_counts(right.option_counts[col])):
+            return False
+    if set(left.crosstabs) != set(right.crosstabs):
+        return False
+    return all(
+        _crosstab_counts(left.crosstabs[pair]).equals(_crosstab_counts(right.crosstabs[pair]))
+        for pair in left.crosstabs
+    )
+
+
+aggregate_store = AggregateStore()
 
-    def fetch_from_sheets() -> pd.DataFrame:
-        return normalize_dataframe_columns(fetch_google_sheet_dataframe())
+
+@timed("fetch_data")
+def fetch_data(force_fallback: bool = False) -> SurveyAggregates:
+    def fetch_from_sql() -> SurveyAggregates:
+        with db_pool.connection() as conn:
+            aggregate_store.refresh_from_sql(conn)
+            cursor = conn.cursor()
+            try:
+                trends = fetch_sql_trends(cursor)
+            finally:
+                cursor.close()
+        aggregates = aggregate_store.snapshot()
+        if trends is not None:
+            aggregates.trends = trends
+        return aggregates
+
+    def fetch_from_sheets() -> SurveyAggregates:
+        aggregate_store.refresh_from_sheets(sheets_reader)
+        return aggregate_store.snapshot()
 
     loaders = {
         "sql": fetch_from_sql,
@@ -243,10 +1932,12 @@ def fetch_data(force_fallback: bool = False) -> pd.DataFrame:
     errors = []
     for source in sources_to_try:
         try:
-            df = loaders[source]()
+            aggregates = loaders[source]()
+            source_loads.inc(source=source, result="ok")
             logger.info("Dashboard data source in use: %s", source)
-            return df
+            return aggregates
         except Exception as exc:
+            source_loads.inc(source=source, result="error")
             errors.append(f"{source}: {exc}")
             logger.exception("Failed loading data from %s", source)
 
@@ -279,25 +1970,21 @@ def apply_figure_style(fig, title_text: str):
     return fig
 
 
-MULTISELECT_COLUMN_HINTS = (
-    "genres",
-    "genre",
-    "géneros",
-    "generos",
-    "what game genres do you enjoy the most",
-    "what games do you enjoy the most",
-    "select up to 2",
-    "select up to two",
-)
+def display_counts(counts: pd.Series) -> pd.Series:
+    """Collapse raw value counts onto the labels shown on the charts."""
+    labels = ["Missing" if pd.isna(value) else str(value) for value in counts.index]
+    return counts.groupby(labels, sort=False).sum()
 
 
-def is_multiselect_column(column_name: str) -> bool:
-    normalized_col = normalize_text(column_name)
-    return any(normalize_text(hint) in normalized_col for hint in MULTISELECT_COLUMN_HINTS)
+def split_multiselect_counts(counts: pd.Series) -> pd.Series:
+    counts = display_counts(counts)
+    pairs = split_multiselect(counts.index)
+    totals = pd.Series(counts.to_numpy(dtype="int64")[pairs["row"].to_numpy()], index=pairs["value"].to_numpy())
+    return totals.groupby(level=0, sort=False).sum()
 
 
-def count_bar(df: pd.DataFrame, col: str, title: str, horizontal: bool = False, split_multiselect: bool = False):
-    if col not in df.columns:
+def count_bar(counts, title: str, horizontal: bool = False, split_multiselect: bool = False):
+    if counts is None:
         fig = px.bar(
             pd.DataFrame({"value": ["No data available"], "count": [0]}),
             x="value",
@@ -308,13 +1995,9 @@ def count_bar(df: pd.DataFrame, col: str, title: str, horizontal: bool = False,
         return apply_figure_style(fig, title)
 
     if split_multiselect:
-        all_values = []
-        for raw_val in df[col].fillna("Missing").astype(str):
-            parts = [p.strip() for p in raw_val.replace(";", ",").split(",") if p.strip()]
-            all_values.extend(parts if parts else ["Missing"])
-        counts = pd.Series(all_values).value_counts().reset_index()
+        counts = split_multiselect_counts(counts).sort_values(ascending=False).reset_index()
     else:
-        counts = df[col].fillna("Missing").astype(str).value_counts().reset_index()
+        counts = display_counts(counts).sort_values(ascending=False).reset_index()
     counts.columns = ["value", "count"]
 
     if horizontal:
@@ -324,6 +2007,7 @@ def count_bar(df: pd.DataFrame, col: str, title: str, horizontal: bool = False,
             y="value",
             orientation="h",
             color="value",
+            custom_data=["value"],
             color_discrete_sequence=color_discrete,
         )
     else:
@@ -332,15 +2016,333 @@ def count_bar(df: pd.DataFrame, col: str, title: str, horizontal: bool = False,
             x="value",
             y="count",
             color="value",
+            custom_data=["value"],
             color_discrete_sequence=color_discrete,
         )
 
     return apply_figure_style(fig, title)
 
 
+def grouped_count_bar(crosstab: pd.DataFrame, title: str):
+    x_col, color_col = crosstab.columns[:2]
+    x_order = crosstab.groupby(x_col, sort=False)["count"].sum().sort_values(ascending=False).index
+    color_order = crosstab.groupby(color_col, sort=False)["count"].sum().sort_values(ascending=False).index
+    fig = px.bar(
+        crosstab,
+        x=x_col,
+        y="count",
+        color=color_col,
+        barmode="group",
+        category_orders={x_col: list(x_order), color_col: list(color_order)},
+        custom_data=[x_col],
+        color_discrete_sequence=color_discrete,
+    )
+    fig = apply_figure_style(fig, title)
+    fig.update_layout(showlegend=True)
+    return fig
+
+
+def numeric_histogram(counts: pd.Series, col: str, title: str):
+    """Histogram from value counts, pre-binned so the figure carries at most
+    ``NUMERIC_HISTOGRAM_BINS`` bars however many distinct values there are."""
+    counts = counts[counts.index.notna()]
+    values = counts.index.to_numpy(dtype=float)
+    bin_counts, edges = np.histogram(
+        values,
+        bins=min(NUMERIC_HISTOGRAM_BINS, len(values)),
+        weights=counts.to_numpy(),
+    )
+    fig = px.bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=bin_counts.astype(int),
+        labels={"x": col, "y": "count"},
+        color_discrete_sequence=color_discrete,
+    )
+    fig.update_traces(marker_color=color_discrete[2], width=float(edges[1] - edges[0]))
+    fig.update_layout(bargap=0)
+    return apply_figure_style(fig, title)
+
+
+def association_heatmap(matrix: pd.DataFrame, title: str):
+    labels = [col.replace("_", " ").title() for col in matrix.columns]
+    fig = px.imshow(
+        matrix.to_numpy(),
+        x=labels,
+        y=labels,
+        zmin=0,
+        zmax=1,
+        text_auto=".2f",
+        aspect="auto",
+        color_continuous_scale=["#FFFFFF", color_discrete[3], color_discrete[1]],
+        labels={"color": "Cramér's V"},
+    )
+    fig = apply_figure_style(fig, title)
+    fig.update_xaxes(tickangle=45, automargin=True)
+    fig.update_yaxes(showgrid=False, automargin=True)
+    return fig
+
+
+def daily_responses_chart(trends: pd.DataFrame, title: str):
+    daily = trends[trends["column"] == "responses"]
+    fig = px.bar(daily, x="day", y="count", labels={"day": "day", "count": "responses"})
+    fig.update_traces(marker_color=color_discrete[2])
+    return apply_figure_style(fig, title)
+
+
+def weekly_share_chart(trends: pd.DataFrame, col: str, title: str):
+    """Share of each answer among a week's answers, weeks starting on Monday."""
+    answers = trends[trends["column"] == col]
+    weeks = answers["day"] - pd.to_timedelta(answers["day"].dt.weekday, unit="D")
+    weekly = answers.groupby([weeks.rename("week"), "value"])["count"].sum().reset_index()
+    weekly["share"] = weekly["count"] / weekly.groupby("week")["count"].transform("sum")
+    fig = px.area(
+        weekly,
+        x="week",
+        y="share",
+        color="value",
+        category_orders={"value": sorted(weekly["value"].unique())},
+        color_discrete_sequence=color_discrete,
+    )
+    fig = apply_figure_style(fig, title)
+    fig.update_yaxes(tickformat=".0%", range=[0, 1])
+    return fig
+
+
+def _is_numeric_counts(counts: pd.Series) -> bool:
+    values = [value for value in counts.index if pd.notna(value)]
+    return bool(values) and all(
+        pd.api.types.is_number(value) and not isinstance(value, bool) for value in values
+    )
+
+
+CachedFigure = collections.namedtuple("CachedFigure", ["figure", "payload_bytes"])
+
+
+def _fingerprint_item(item):
+    if isinstance(item, pd.Series):
+        return sorted((str(index), int(count)) for index, count in item.items())
+    if isinstance(item, pd.DataFrame):
+        return sorted(tuple(str(value) for value in row) for row in item.itertuples(index=False))
+    if isinstance(item, tuple):
+        return tuple(_fingerprint_item(part) for part in item)
+    return item
+
+
+def content_fingerprint(*inputs) -> str:
+    """Cheap, order-insensitive hash of the counts a chart is drawn from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for item in inputs:
+        digest.update(repr(_fingerprint_item(item)).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """LRU of serialized figures keyed by chart builder plus input fingerprint."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached entry for ``key`` or None, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                figure_cache_requests.inc(result="hit")
+                return entry
+            self.misses += 1
+            figure_cache_requests.inc(result="miss")
+            return None
+
+    def put(self, key, figure_json: str) -> CachedFigure:
+        entry = CachedFigure(json.loads(figure_json), len(figure_json))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+figure_cache = FigureCache(FIGURE_CACHE_SIZE)
+
+
+def render_figure(builder, args):
+    """Build and serialize one chart, returning ``(figure_json, seconds)``.
+
+    Module-level so a process pool can pickle it along with the builder.
+    """
+    started = time.perf_counter()
+    figure_json = plotly.io.to_json(builder(*args), validate=False)
+    return figure_json, time.perf_counter() - started
+
+
+_build_executor = None
+_build_executor_lock = threading.Lock()
+
+
+def get_build_executor():
+    """Lazily start the pool that renders dashboard charts; None when building serially."""
+    global _build_executor
+
+    if DASHBOARD_BUILD_WORKERS <= 1:
+        return None
+    with _build_executor_lock:
+        if _build_executor is None:
+            if DASHBOARD_BUILD_EXECUTOR == "process":
+                # Each child imports the whole app, so this is opt-in for hosts with
+                # spare cores and memory. Children start from a clean forkserver (or
+                # are spawned) rather than forked from this multithreaded process.
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _build_executor = concurrent.futures.ProcessPoolExecutor(
+                    DASHBOARD_BUILD_WORKERS, mp_context=multiprocessing.get_context(start_method)
+                )
+            else:
+                _build_executor = concurrent.futures.ThreadPoolExecutor(
+                    DASHBOARD_BUILD_WORKERS, thread_name_prefix="dashboard-build"
+                )
+        return _build_executor
+
+
+@atexit.register
+def _shutdown_build_executor() -> None:
+    if _build_executor is not None:
+        _build_executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_build_executor(executor) -> None:
+    global _build_executor
+
+    with _build_executor_lock:
+        if _build_executor is executor:
+            _build_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = dash.Dash(__name__)
 server = app.server
 
+
+@server.route("/healthz")
+def healthz():
+    status = {"pool": db_pool.stats(), "scheduler": scheduler.stats()}
+    if DASHBOARD_SOURCE != "sql":
+        # The sync only runs in SQL mode, and Sheets mode reaches MySQL only as
+        # a fallback, so its reachability says nothing about this worker's health.
+        status["database"] = "not used"
+        return flask.jsonify(status), 200
+    try:
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+        status["database"] = "ok"
+        return flask.jsonify(status), 200
+    except Exception as exc:
+        status["database"] = f"error: {exc}"
+        return flask.jsonify(status), 503
+
+
+def _dashboard_cache_age() -> float:
+    with _cache_lock:
+        return float("nan") if _cached_dashboard is None else time.time() - _last_dashboard_epoch
+
+
+def _dashboard_payload_bytes() -> int:
+    with _cache_lock:
+        return sum(dashboard_payload_report.values())
+
+
+metrics.register(
+    Gauge(
+        "survey_dashboard_cache_age_seconds",
+        "Seconds since the served dashboard was built.",
+        function=_dashboard_cache_age,
+    )
+)
+metrics.register(
+    Gauge(
+        "survey_dashboard_payload_bytes",
+        "JSON bytes of every figure in the served build.",
+        function=_dashboard_payload_bytes,
+    )
+)
+metrics.register(
+    Gauge(
+        "survey_store_rows",
+        "Responses held in the local aggregate store.",
+        function=lambda: aggregate_store.responses.row_count,
+    )
+)
+http_responses = metrics.register(
+    Counter("survey_http_responses_total", "HTTP responses by route and status.", ["route", "status"])
+)
+http_response_bytes = metrics.register(
+    Counter("survey_http_response_bytes_total", "HTTP response body bytes by route.", ["route"])
+)
+
+
+@server.route("/metrics")
+def metrics_endpoint():
+    return flask.Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+def _request_route() -> str:
+    rule = flask.request.url_rule
+    return rule.rule if rule is not None else "unmatched"
+
+
+@server.before_request
+def _start_request_profile():
+    if not PROFILE_REQUESTS_DIR or random.random() >= PROFILE_REQUESTS_SAMPLE_RATE:
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is already active on this thread.
+        return
+    flask.g.profiler = profiler
+
+
+@server.after_request
+def _count_response(response):
+    route = _request_route()
+    http_responses.inc(route=route, status=response.status_code)
+    if not response.direct_passthrough:
+        http_response_bytes.inc(response.calculate_content_length() or 0, route=route)
+    return response
+
+
+@server.teardown_request
+def _finish_request_profile(_exc):
+    profiler = flask.g.pop("profiler", None)
+    if profiler is None:
+        return
+    profiler.disable()
+    name = flask.request.path
+    if flask.request.path == "/_dash-update-component":
+        name += "-" + str((flask.request.get_json(silent=True) or {}).get("output", ""))
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")[:80] or "root"
+    try:
+        os.makedirs(PROFILE_REQUESTS_DIR, exist_ok=True)
+        profiler.dump_stats(os.path.join(PROFILE_REQUESTS_DIR, f"{int(time.time() * 1000)}-{os.getpid()}-{slug}.prof"))
+    except OSError:
+        logger.exception("Failed writing request profile to %s", PROFILE_REQUESTS_DIR)
+
 app.layout = html.Div(
     style={"backgroundColor": "white", "padding": "16px", "width": "100%", "minHeight": "100vh"},
     children=[
@@ -355,127 +2357,237 @@ app.layout = html.Div(
             },
         ),
         dcc.Interval(id="refresh-interval", interval=DASHBOARD_REFRESH_SECONDS * 1000, n_intervals=0),
+        dcc.Store(id="dashboard-version"),
+        dcc.Store(id="lazy-page", data=0),
+        dcc.Store(id="cross-filter", data={}),
+        html.Div(
+            id="cross-filter-bar",
+            style={"display": "none"},
+            children=[
+                html.Span(id="cross-filter-summary", style={"marginRight": "12px"}),
+                html.Button("Clear filters", id="clear-cross-filter", n_clicks=0),
+            ],
+        ),
         html.Div(id="dashboard-content"),
+        html.Div(
+            id="lazy-charts",
+            style={
+                "display": "grid",
+                "gridTemplateColumns": "repeat(auto-fit, minmax(420px, 1fr))",
+                "gap": "16px",
+                "marginTop": "16px",
+                "alignItems": "stretch",
+            },
+        ),
+        html.Div(
+            id="lazy-pager",
+            style={"display": "none"},
+            children=[
+                html.Button("Previous charts", id="lazy-prev", n_clicks=0),
+                html.Span(id="lazy-pager-label", style={"margin": "0 12px"}),
+                html.Button("Next charts", id="lazy-next", n_clicks=0),
+            ],
+        ),
     ],
 )
 
 
-def build_dashboard_children(df: pd.DataFrame):
-    if df.empty:
-        return html.Div(
-            "No rows found in the current data source yet.",
-            style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
-        )
+@server.route("/dashboard/payload")
+def dashboard_payload():
+    with _cache_lock:
+        report = dict(dashboard_payload_report)
+        timings = {name: round(seconds, 4) for name, seconds in dashboard_build_timings.items()}
+    return flask.jsonify(
+        {
+            "total_bytes": sum(report.values()),
+            "figures": report,
+            "build_seconds": timings,
+            "figure_cache": figure_cache.stats(),
+        }
+    )
 
-    drop_cols = {"timestamp", "marca temporal", "id"}
-    df = df.loc[:, [c for c in df.columns if c.lower() not in drop_cols]]
 
-    if df.empty or len(df.columns) == 0:
-        return html.Div(
-            "Data loaded, but no plottable columns were found after normalization.",
-            style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
-        )
+PRIORITY_CHARTS = [
+    "inclusive_interest",
+    "identity",
+    "player_gender",
+    "orientation",
+    "orientation_importance",
+]
 
-    def has_usable_data(col: str) -> bool:
-        if col not in df.columns:
-            return False
-        cleaned = (
-            df[col]
-            .dropna()
-            .astype(str)
-            .map(lambda value: value.strip())
-        )
-        cleaned = cleaned[cleaned != ""]
-        return not cleaned.empty
 
-    fig_inclusive = count_bar(df, "inclusive_interest", "Interest Due to Inclusive Options")
+def optimal_graph(col: str, counts: pd.Series, option_counts=None):
+    title = col.replace("_", " ").title()
+    unique_vals = len(counts)
 
-    if "identity" in df.columns and "player_gender" in df.columns:
-        fig_identity = px.histogram(
-            df,
-            x="identity",
-            color="player_gender",
-            barmode="group",
-            color_discrete_sequence=color_discrete,
+    if _is_numeric_counts(counts) and unique_vals > 10:
+        return numeric_histogram(counts, col, title)
+
+    if unique_vals <= 5:
+        return count_bar(counts, title, horizontal=True)
+
+    is_multiselect = is_multiselect_column(col)
+    if is_multiselect and option_counts is not None:
+        fig = count_bar(option_counts, title, horizontal=False)
+    else:
+        fig = count_bar(counts, title, horizontal=False, split_multiselect=is_multiselect)
+    if is_multiselect:
+        fig.update_xaxes(tickangle=45, automargin=True)
+    return fig
+
+
+def dashboard_chart_specs(aggregates: SurveyAggregates) -> dict:
+    """Map each chart name to the ``(builder, args)`` that draws it from the aggregates."""
+    value_counts = aggregates.value_counts
+    crosstabs = aggregates.crosstabs
+
+    specs = {
+        "inclusive_interest": (
+            count_bar,
+            (value_counts.get("inclusive_interest"), "Interest Due to Inclusive Options"),
+        ),
+    }
+
+    if ("identity", "player_gender") in crosstabs:
+        specs["identity"] = (
+            grouped_count_bar,
+            (crosstabs[("identity", "player_gender")], "Gender Identity vs. Player Gender Choice"),
         )
-        fig_identity = apply_figure_style(fig_identity, "Gender Identity vs. Player Gender Choice")
-        fig_identity.update_layout(showlegend=True)
     else:
-        fig_identity = count_bar(df, "identity", "Gender Identity vs. Player Gender Choice")
+        specs["identity"] = (count_bar, (value_counts.get("identity"), "Gender Identity vs. Player Gender Choice"))
 
-    fig_player_gender = count_bar(df, "player_gender", "Player Gender")
+    specs["player_gender"] = (count_bar, (value_counts.get("player_gender"), "Player Gender"))
 
-    if "orientation" in df.columns and "orientation_importance" in df.columns:
-        fig_orientation = px.histogram(
-            df,
-            x="orientation",
-            color="orientation_importance",
-            barmode="group",
-            color_discrete_sequence=color_discrete,
+    if ("orientation", "orientation_importance") in crosstabs:
+        specs["orientation"] = (
+            grouped_count_bar,
+            (crosstabs[("orientation", "orientation_importance")], "Sexual Orientation vs. Importance"),
         )
-        fig_orientation = apply_figure_style(fig_orientation, "Sexual Orientation vs. Importance")
-        fig_orientation.update_layout(showlegend=True)
     else:
-        fig_orientation = count_bar(df, "orientation", "Sexual Orientation vs. Importance")
+        specs["orientation"] = (count_bar, (value_counts.get("orientation"), "Sexual Orientation vs. Importance"))
 
-    fig_orientation_importance = count_bar(
-        df,
-        "orientation_importance",
-        "Orientation Importance",
+    specs["orientation_importance"] = (
+        count_bar,
+        (value_counts.get("orientation_importance"), "Orientation Importance"),
     )
 
-    def optimal_graph(col: str):
-        title = col.replace("_", " ").title()
-        unique_vals = df[col].nunique(dropna=False)
-
-        if pd.api.types.is_numeric_dtype(df[col]) and unique_vals > 10:
-            fig = px.histogram(df, x=col, color_discrete_sequence=color_discrete)
-            fig.update_traces(marker_color=color_discrete[2])
-            return apply_figure_style(fig, title)
-
-        if unique_vals <= 5:
-            return count_bar(df, col, title, horizontal=True)
-
-        is_multiselect = is_multiselect_column(col)
-        fig = count_bar(df, col, title, horizontal=False, split_multiselect=is_multiselect)
-        if is_multiselect:
-            fig.update_xaxes(tickangle=45, automargin=True)
-        return fig
-
-    remaining_cols = [
-        c
-        for c in df.columns
-        if c
-        not in [
-            "inclusive_interest",
-            "identity",
-            "player_gender",
-            "orientation",
-            "orientation_importance",
-        ]
-    ]
-
-    priority_card_items = []
-    if has_usable_data("inclusive_interest"):
-        priority_card_items.append(
-            html.Div([dcc.Graph(figure=fig_inclusive, style={"height": "420px"})], style={"minWidth": "360px"})
-        )
-    if has_usable_data("identity"):
-        priority_card_items.append(
-            html.Div([dcc.Graph(figure=fig_identity, style={"height": "420px"})], style={"minWidth": "360px"})
+    if aggregates.associations is not None:
+        specs["associations"] = (
+            association_heatmap,
+            (aggregates.associations, "Association Between Answers (Cramér's V)"),
         )
-    if has_usable_data("player_gender"):
-        priority_card_items.append(
-            html.Div([dcc.Graph(figure=fig_player_gender, style={"height": "420px"})], style={"minWidth": "360px"})
-        )
-    if has_usable_data("orientation"):
-        priority_card_items.append(
-            html.Div([dcc.Graph(figure=fig_orientation, style={"height": "420px"})], style={"minWidth": "360px"})
-        )
-    if has_usable_data("orientation_importance"):
-        priority_card_items.append(
-            html.Div([dcc.Graph(figure=fig_orientation_importance, style={"height": "420px"})], style={"minWidth": "360px"})
+
+    trends = aggregates.trends
+    if trends is not None and not trends.empty:
+        specs["responses_per_day"] = (daily_responses_chart, (trends, "Responses per Day"))
+        for col in TREND_COLUMNS:
+            if (trends["column"] == col).any():
+                title = f"Weekly Share of {col.replace('_', ' ').title()} Answers"
+                specs[f"{col}_trend"] = (weekly_share_chart, (trends, col, title))
+
+    for col in aggregates.columns:
+        if col not in PRIORITY_CHARTS:
+            specs[col] = (optimal_graph, (col, value_counts[col], aggregates.option_counts.get(col)))
+    return specs
+
+
+def build_dashboard_figures(aggregates: SurveyAggregates) -> dict:
+    """Return a CachedFigure per chart name, rebuilding only charts whose inputs changed."""
+    started = time.perf_counter()
+    specs = dashboard_chart_specs(aggregates)
+    keys = {name: (builder.__name__, content_fingerprint(*args)) for name, (builder, args) in specs.items()}
+
+    figures = {}
+    timings = {}
+    misses = []
+    for name, key in keys.items():
+        entry = figure_cache.get(key)
+        if entry is None:
+            misses.append(name)
+        else:
+            figures[name] = entry
+            timings[name] = 0.0
+
+    builders = [specs[name][0] for name in misses]
+    arguments = [specs[name][1] for name in misses]
+    executor = get_build_executor() if len(misses) > 1 else None
+    try:
+        rendered = list((executor.map if executor is not None else map)(render_figure, builders, arguments))
+    except concurrent.futures.BrokenExecutor:
+        logger.exception("Dashboard build pool failed; rendering charts serially")
+        _discard_build_executor(executor)
+        rendered = list(map(render_figure, builders, arguments))
+
+    for name, (figure_json, seconds) in zip(misses, rendered):
+        figures[name] = figure_cache.put(keys[name], figure_json)
+        timings[name] = seconds
+        stage_seconds.observe(seconds, stage="render_figure")
+    figures = {name: figures[name] for name in specs}
+
+    payload_report = {name: entry.payload_bytes for name, entry in figures.items()}
+    with _cache_lock:
+        dashboard_payload_report.clear()
+        dashboard_payload_report.update(payload_report)
+        dashboard_build_timings.clear()
+        dashboard_build_timings.update(timings)
+    slowest = max(timings, key=timings.get)
+    logger.info(
+        "Dashboard figures ready: %d charts (%d rendered) in %.3fs, slowest %s %.3fs, "
+        "%d bytes of figure JSON (cache %s)",
+        len(payload_report),
+        len(misses),
+        time.perf_counter() - started,
+        slowest,
+        timings[slowest],
+        sum(payload_report.values()),
+        figure_cache.stats(),
+    )
+    return figures
+
+
+@timed("build_dashboard_children")
+def build_dashboard_children(aggregates: SurveyAggregates):
+    """Return the priority cards and, separately, every chart's figure by name.
+
+    Only the cards go out with the dashboard poll; the other charts are paged in
+    one figure per request by ``load_lazy_chart``.
+    """
+    if aggregates.row_count == 0:
+        return html.Div(
+            "No rows found in the current data source yet.",
+            style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
+        ), {}
+
+    columns = aggregates.columns
+    if len(columns) == 0:
+        return html.Div(
+            "Data loaded, but no plottable columns were found after normalization.",
+            style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
+        ), {}
+
+    value_counts = aggregates.value_counts
+
+    def has_usable_data(col: str) -> bool:
+        if col not in value_counts:
+            return False
+        return any(pd.notna(value) and str(value).strip() != "" for value in value_counts[col].index)
+
+    figures = build_dashboard_figures(aggregates)
+
+    priority_card_items = [
+        html.Div(
+            [
+                dcc.Graph(
+                    id={"type": "priority-graph", "index": name},
+                    figure=figures[name].figure,
+                    style={"height": "420px"},
+                )
+            ],
+            style={"minWidth": "360px"},
         )
+        for name in PRIORITY_CHARTS
+        if has_usable_data(name)
+    ]
 
     priority_cards = html.Div(
         priority_card_items,
@@ -487,95 +2599,624 @@ def build_dashboard_children(df: pd.DataFrame):
         },
     )
 
-    other_graphs = html.Div(
-        [
-            html.Div([dcc.Graph(figure=optimal_graph(col), style={"height": "360px"})], style={"minWidth": "360px"})
-            for col in remaining_cols
-        ],
-        style={
-            "display": "grid",
-            "gridTemplateColumns": "repeat(auto-fit, minmax(420px, 1fr))",
-            "gap": "16px",
-            "marginTop": "16px",
-            "alignItems": "stretch",
-        },
-    )
-
     sections = []
     if priority_card_items:
         sections.append(priority_cards)
-    sections.append(other_graphs)
-    return html.Div(sections)
+    return html.Div(sections), {name: entry.figure for name, entry in figures.items()}
+
+
+class SharedDashboardCache:
+    """Serialized dashboard and its version in a SQLite file shared by all workers on the host.
+
+    A lease row makes refreshes single-flight across processes: only the worker
+    holding an unexpired lease rebuilds, and the others read its result.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS dashboard_cache "
+                "(name TEXT PRIMARY KEY, version TEXT, built_at REAL, payload TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_lease (name TEXT PRIMARY KEY, owner TEXT, expires_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def peek(self):
+        """Return ``(version, built_at)`` of the shared build without loading its payload."""
+        with self._connect() as conn:
+            return conn.execute("SELECT version, built_at FROM dashboard_cache WHERE name = 'dashboard'").fetchone()
+
+    def load(self):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, built_at, version FROM dashboard_cache WHERE name = 'dashboard'"
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def store(self, dashboard, built_at: float, version: str) -> None:
+        payload = json.dumps(dashboard, cls=plotly.utils.PlotlyJSONEncoder)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO dashboard_cache (name, version, built_at, payload) VALUES ('dashboard', ?, ?, ?)",
+                (version, built_at, payload),
+            )
+
+    def try_acquire(self, owner: str, ttl: float, name: str = "dashboard") -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT owner, expires_at FROM refresh_lease WHERE name = ?", (name,)).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO refresh_lease (name, owner, expires_at) VALUES (?, ?, ?)",
+                (name, owner, now + ttl),
+            )
+            conn.execute("COMMIT")
+            return True
+
+    def release(self, owner: str, name: str = "dashboard") -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM refresh_lease WHERE name = ? AND owner = ?", (name, owner))
+
+
+def _open_shared_cache():
+    if not DASHBOARD_SHARED_CACHE_PATH:
+        return None
+    try:
+        return SharedDashboardCache(DASHBOARD_SHARED_CACHE_PATH)
+    except Exception:
+        logger.exception("Shared dashboard cache unavailable; caching per process only")
+        return None
+
+
+shared_dashboard_cache = _open_shared_cache()
+_worker_id = f"{socket.gethostname()}:{os.getpid()}"
 
 
 def _get_cached_dashboard():
+    """Return the newest build, pulling it from the shared cache if another worker refreshed."""
+    if shared_dashboard_cache is not None:
+        try:
+            shared = shared_dashboard_cache.peek()
+            with _cache_lock:
+                local_version, local_epoch = _cached_dashboard_version, _last_dashboard_epoch
+            if shared is not None and (shared[0] != local_version or shared[1] > local_epoch):
+                loaded = shared_dashboard_cache.load()
+                if loaded is not None:
+                    _set_cached_dashboard(*loaded, publish=False)
+        except Exception:
+            logger.exception("Failed reading the shared dashboard cache")
+
     with _cache_lock:
-        return _cached_dashboard_children, _last_dashboard_epoch
+        return _cached_dashboard, _last_dashboard_epoch, _cached_dashboard_version
 
 
-def _set_cached_dashboard(children, timestamp: float) -> None:
-    global _cached_dashboard_children, _last_dashboard_epoch
+def _set_cached_dashboard(dashboard, timestamp: float, version: str, publish: bool = True) -> None:
+    global _cached_dashboard, _last_dashboard_epoch, _cached_dashboard_version
     with _cache_lock:
-        _cached_dashboard_children = children
+        _cached_dashboard = dashboard
         _last_dashboard_epoch = timestamp
+        _cached_dashboard_version = version
+    if publish and shared_dashboard_cache is not None:
+        try:
+            shared_dashboard_cache.store(dashboard, timestamp, version)
+        except Exception:
+            logger.exception("Failed publishing the dashboard to the shared cache")
 
 
-def _refresh_dashboard_cache() -> None:
-    global _cache_refresh_in_progress
+def build_dashboard(aggregates: SurveyAggregates):
+    """Return the dashboard and the data version it renders.
+
+    The dashboard holds the priority-card ``children``, every figure under
+    ``charts`` and the ``lazy`` chart names paged in below them.
+    """
+    children, charts = build_dashboard_children(aggregates)
+    lazy = [name for name in charts if name not in PRIORITY_CHARTS]
+    return {"children": children, "charts": charts, "lazy": lazy}, aggregates.fingerprint()
+
+
+def _acquire_refresh_lease(name: str = "dashboard") -> bool:
+    if shared_dashboard_cache is None:
+        return True
     try:
-        if RUN_SYNC_IN_REQUEST and DASHBOARD_SOURCE == "sql":
-            try:
-                sync_google_sheet_to_mysql()
-            except Exception:
-                logger.exception("Google Sheets to MySQL sync failed during background refresh")
+        return shared_dashboard_cache.try_acquire(_worker_id, DASHBOARD_REFRESH_LEASE_SECONDS, name)
+    except Exception:
+        logger.exception("Failed acquiring the dashboard refresh lease")
+        return True
 
-        df = fetch_data(force_fallback=True)
-        children = build_dashboard_children(df)
-        _set_cached_dashboard(children, time.time())
+
+def _release_refresh_lease(name: str = "dashboard") -> None:
+    if shared_dashboard_cache is None:
+        return
+    try:
+        shared_dashboard_cache.release(_worker_id, name)
     except Exception:
-        logger.exception("Background dashboard cache refresh failed")
+        logger.exception("Failed releasing the dashboard refresh lease")
+
+
+def _rebuild_dashboard_cache(force: bool = False, published_since: float = 0.0) -> None:
+    """Rebuild and publish the dashboard, unless another worker holds the lease or already has.
+
+    A build published after ``published_since`` (the end of this worker's previous
+    refresh) came from another worker in the meantime and is kept. ``force`` skips
+    that check, e.g. right after a sync inserted rows.
+    """
+    if not _acquire_refresh_lease():
+        return
+    try:
+        cached_dashboard, cached_epoch, _ = _get_cached_dashboard()
+        if not force and cached_dashboard is not None and cached_epoch > published_since:
+            return
+
+        dashboard, version = build_dashboard(fetch_data(force_fallback=True))
+        _set_cached_dashboard(dashboard, time.time(), version)
+        aggregate_store.update_bitmap_index()
+        save_store_snapshot(version)
+    finally:
+        _release_refresh_lease()
+
+
+_snapshot_store_version = None
+_snapshot_saved_at = 0.0
+
+
+def save_store_snapshot(data_version: str, force: bool = False) -> None:
+    """Persist the store if it changed, at most every SNAPSHOT_INTERVAL_SECONDS unless ``force``.
+
+    Each write copies every encoded column, so the refreshes in between stay
+    O(new rows); the latest state is written when the worker exits.
+    """
+    global _snapshot_store_version, _snapshot_saved_at
+
+    if not SNAPSHOT_DIR or not aggregate_store.ready or aggregate_store.version == _snapshot_store_version:
+        return
+    if not force and time.time() - _snapshot_saved_at < SNAPSHOT_INTERVAL_SECONDS:
+        return
+    try:
+        aggregate_store.save_snapshot(SNAPSHOT_DIR, data_version)
+        _snapshot_store_version = aggregate_store.version
+        _snapshot_saved_at = time.time()
+    except Exception:
+        logger.exception("Failed writing the response snapshot")
+
+
+@atexit.register
+def save_store_snapshot_on_exit() -> None:
+    """Write any changes held back by the snapshot interval; gunicorn calls it once jobs have stopped."""
+    with _cache_lock:
+        version = _cached_dashboard_version
+    save_store_snapshot(version, force=True)
+
+
+def load_startup_snapshot() -> None:
+    """Serve the last persisted snapshot right away; the next refresh reconciles it."""
+    if not SNAPSHOT_DIR:
+        return
+    try:
+        meta = aggregate_store.load_snapshot(SNAPSHOT_DIR)
+        if meta is None:
+            return
+        dashboard, version = build_dashboard(aggregate_store.snapshot())
+    except Exception:
+        logger.exception("Ignoring unreadable response snapshot in %s", SNAPSHOT_DIR)
+        return
+
+    # Epoch 0 marks the build stale, so the scheduler's first refresh reconciles
+    # it with the source, and any newer build in the shared cache takes precedence.
+    _set_cached_dashboard(dashboard, 0.0, version, publish=False)
+    logger.info(
+        "Serving snapshot of %d responses from %s (source %s, position %s)",
+        aggregate_store.responses.row_count,
+        SNAPSHOT_DIR,
+        meta["source"],
+        meta["position"],
+    )
+
+
+class ScheduledJob:
+    """A recurring job: its cadence, the job it chains to, and its failure streak."""
+
+    def __init__(self, name: str, func, interval_seconds: float, run_immediately: bool = True, chain=None):
+        self.name = name
+        self.func = func
+        self.interval_seconds = max(float(interval_seconds), 1.0)
+        self.run_immediately = run_immediately
+        self.chain = chain
+        self.wake = threading.Event()
+        self.running = threading.Lock()
+        self.runs = 0
+        self.failures = 0
+        self.last_success_at = None
+        self.last_error = None
+
+    def next_delay(self) -> float:
+        """Seconds until the next run: the cadence, or exponential backoff after failures, jittered."""
+        if self.failures:
+            delay = min(SCHEDULER_MAX_BACKOFF_SECONDS, SCHEDULER_RETRY_SECONDS * 2 ** (self.failures - 1))
+        else:
+            delay = self.interval_seconds
+        return delay * random.uniform(1 - SCHEDULER_JITTER_RATIO, 1 + SCHEDULER_JITTER_RATIO)
+
+
+class BackgroundScheduler:
+    """Runs each job on its own daemon thread so sync and refresh keep independent cadences.
+
+    A job never overlaps itself, a trigger runs it as soon as its thread is free,
+    and a job whose result is truthy triggers its ``chain`` job right away.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self._threads = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, func, interval_seconds: float, run_immediately: bool = True, chain=None) -> None:
+        self._jobs[name] = ScheduledJob(name, func, interval_seconds, run_immediately, chain)
+
+    @property
+    def running(self) -> bool:
+        with self._lock:
+            return bool(self._threads)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            self._stop.clear()
+            for job in self._jobs.values():
+                thread = threading.Thread(
+                    target=self._run_loop, args=(job,), name=f"scheduler-{job.name}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info("Background scheduler started in %s with jobs %s", _worker_id, sorted(self._jobs))
+
+    def stop(self, timeout: float = 10.0) -> None:
+        with self._lock:
+            threads, self._threads = self._threads, []
+            self._stop.set()
+            for job in self._jobs.values():
+                job.wake.set()
+        for thread in threads:
+            thread.join(timeout)
+        if threads:
+            logger.info("Background scheduler stopped in %s", _worker_id)
+
+    def trigger(self, name: str) -> None:
+        self._jobs[name].wake.set()
+
+    def run_job(self, name: str, triggered: bool = False):
+        """Run a job now unless it is already running; returns its result or None."""
+        job = self._jobs[name]
+        if not job.running.acquire(blocking=False):
+            return None
+        try:
+            result = job.func(triggered)
+        except Exception as exc:
+            job.failures += 1
+            job.last_error = repr(exc)
+            job_failures.inc(job=name)
+            logger.exception("Scheduled job %s failed (%d in a row)", name, job.failures)
+            return None
+        finally:
+            job.runs += 1
+            job.running.release()
+
+        job.failures = 0
+        job.last_success_at = time.time()
+        if result and job.chain is not None:
+            self.trigger(job.chain)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "interval_seconds": job.interval_seconds,
+                "runs": job.runs,
+                "failures": job.failures,
+                "last_success_at": job.last_success_at,
+                "last_error": job.last_error,
+            }
+            for name, job in self._jobs.items()
+        }
+
+    def _run_loop(self, job: ScheduledJob) -> None:
+        delay = 0.0 if job.run_immediately else job.next_delay()
+        while True:
+            job.wake.wait(delay)
+            if self._stop.is_set():
+                return
+            triggered = job.wake.is_set()
+            job.wake.clear()
+            self.run_job(job.name, triggered)
+            delay = job.next_delay()
+
+
+def run_scheduled_sync(triggered: bool = False) -> int:
+    """Sync job: one worker per host at a time copies new sheet rows into MySQL."""
+    if not SYNC_FROM_GOOGLE_SHEETS or DASHBOARD_SOURCE != "sql":
+        return 0
+    if not _acquire_refresh_lease("sync"):
+        return 0
+    try:
+        return sync_google_sheet_to_mysql()
     finally:
-        _cache_refresh_in_progress = False
+        _release_refresh_lease("sync")
+
+
+# Builds published before this process started are not "since the last refresh":
+# a restarted worker reconciles them with the source on its first run.
+_refresh_finished_at = time.time()
+
+
+def run_scheduled_refresh(triggered: bool = False) -> None:
+    """Refresh job: rebuild on every run unless another worker published since the last one.
+
+    Triggered runs (after a sync, or from a cold request) always rebuild.
+    """
+    global _refresh_finished_at
+
+    try:
+        _rebuild_dashboard_cache(force=triggered, published_since=_refresh_finished_at)
+    finally:
+        _refresh_finished_at = time.time()
+
+
+scheduler = BackgroundScheduler()
+scheduler.add_job("sync", run_scheduled_sync, SYNC_INTERVAL_SECONDS, chain="refresh")
+scheduler.add_job("refresh", run_scheduled_refresh, DASHBOARD_CACHE_SECONDS, run_immediately=PREWARM_CACHE_ON_START)
+
+
+def _wait_for_dashboard(timeout: float) -> None:
+    """Cold start: wait for the scheduler, here or in another worker, to publish a build."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        cached_dashboard, _, _ = _get_cached_dashboard()
+        if cached_dashboard is not None:
+            return
+        time.sleep(0.25)
 
 
 @app.callback(
-    dash.dependencies.Output("dashboard-content", "children"),
+    [
+        dash.dependencies.Output("dashboard-content", "children"),
+        dash.dependencies.Output("dashboard-version", "data"),
+    ],
     [dash.dependencies.Input("refresh-interval", "n_intervals")],
+    [dash.dependencies.State("dashboard-version", "data")],
 )
-def update_dashboard(_n_intervals):
-    global _cache_refresh_in_progress
-
-    current_time = time.time()
-    cached_dashboard, cached_epoch = _get_cached_dashboard()
+@timed("update_dashboard")
+def update_dashboard(_n_intervals, client_version):
+    # Under gunicorn the worker hooks own the scheduler; this covers any other host.
+    if not scheduler.running:
+        scheduler.start()
+
+    # Requests never query MySQL or Sheets themselves: a cold one nudges the
+    # scheduler and waits for its build.
+    cached_dashboard, _, cached_version = _get_cached_dashboard()
+    if cached_dashboard is None:
+        dashboard_polls.inc(result="cold")
+        scheduler.trigger("refresh")
+        _wait_for_dashboard(COLD_START_WAIT_SECONDS)
+        cached_dashboard, _, cached_version = _get_cached_dashboard()
 
     if cached_dashboard is not None:
-        cache_age = current_time - cached_epoch
-        if cache_age >= DASHBOARD_CACHE_SECONDS and not _cache_refresh_in_progress:
-            _cache_refresh_in_progress = True
-            threading.Thread(target=_refresh_dashboard_cache, daemon=True).start()
-        return cached_dashboard
+        # The browser already shows this version; skip re-sending the whole tree.
+        if client_version == cached_version:
+            dashboard_polls.inc(result="unchanged")
+            return dash.no_update, dash.no_update
+        dashboard_polls.inc(result="sent")
+        return cached_dashboard["children"], cached_version
 
-    try:
-        df = fetch_data(force_fallback=True)
-        dashboard_children = build_dashboard_children(df)
-        _set_cached_dashboard(dashboard_children, current_time)
-        return dashboard_children
-    except Exception:
-        logger.exception("Failed while preparing initial dashboard")
-        return html.Div(
-            "Dashboard is online, but data is not available yet. Check GOOGLE_SHEET_NAME, GOOGLE_SERVICE_ACCOUNT_JSON, database connectivity, and Google Sheet sharing permissions.",
-            style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
+    dashboard_polls.inc(result="unavailable")
+    return html.Div(
+        "Dashboard is online, but data is not available yet. Check GOOGLE_SHEET_NAME, GOOGLE_SERVICE_ACCOUNT_JSON, database connectivity, and Google Sheet sharing permissions.",
+        style={"fontFamily": "Arial", "fontSize": "14px", "color": "black", "padding": "12px"},
+    ), None
+
+
+@app.callback(
+    [
+        dash.dependencies.Output("lazy-charts", "children"),
+        dash.dependencies.Output("lazy-page", "data"),
+        dash.dependencies.Output("lazy-pager-label", "children"),
+        dash.dependencies.Output("lazy-pager", "style"),
+    ],
+    [
+        dash.dependencies.Input("dashboard-version", "data"),
+        dash.dependencies.Input("lazy-prev", "n_clicks"),
+        dash.dependencies.Input("lazy-next", "n_clicks"),
+    ],
+    [dash.dependencies.State("lazy-page", "data")],
+)
+def update_lazy_page(_version, _prev_clicks, _next_clicks, page):
+    """Lay out empty graphs for one page of below-the-fold charts; each fetches its own figure."""
+    cached_dashboard, _, _ = _get_cached_dashboard()
+    names = cached_dashboard["lazy"] if cached_dashboard is not None else []
+    page_count = max(1, -(-len(names) // LAZY_CHARTS_PAGE_SIZE))
+
+    page = page or 0
+    if dash.ctx.triggered_id == "lazy-prev":
+        page -= 1
+    elif dash.ctx.triggered_id == "lazy-next":
+        page += 1
+    page = min(max(page, 0), page_count - 1)
+
+    visible = names[page * LAZY_CHARTS_PAGE_SIZE : (page + 1) * LAZY_CHARTS_PAGE_SIZE]
+    graphs = [
+        html.Div(
+            [dcc.Loading(dcc.Graph(id={"type": "lazy-graph", "index": name}, style={"height": "360px"}))],
+            style={"minWidth": "360px"},
         )
+        for name in visible
+    ]
+    label = f"Page {page + 1} of {page_count}"
+    pager_style = {
+        "display": "flex" if page_count > 1 else "none",
+        "alignItems": "center",
+        "justifyContent": "center",
+        "marginTop": "16px",
+        "fontFamily": "Arial",
+        "fontSize": "14px",
+    }
+    return graphs, page, label, pager_style
+
+
+# Charts drawn from store-wide state the bitmap index does not break down by
+# row; under a cross-filter they keep their unfiltered figure, labelled as such.
+UNFILTERED_CHARTS = {"associations", "responses_per_day", *(f"{col}_trend" for col in TREND_COLUMNS)}
+
+
+def _mark_unfiltered(figure):
+    if figure is None:
+        return None
+    layout = dict(figure.get("layout") or {})
+    title = dict(layout.get("title") or {})
+    title["text"] = f"{title.get('text', '')} <i>(all responses, not cross-filtered)</i>"
+    layout["title"] = title
+    return {**figure, "layout": layout}
+
+
+def cross_filtered_figure(name: str, filters: dict):
+    """Figure for chart ``name`` with every cross-filter but its own applied, or None if unfiltered.
+
+    Counts come from the local store's bitmap index, so a filter change costs
+    bitmap ANDs and popcounts plus rendering any figure not already cached.
+    Until the refresh job has built an index here, charts stay unfiltered and
+    the filter bar says so; ``UNFILTERED_CHARTS`` always do and say so in their title.
+    """
+    filters = {col: label for col, label in (filters or {}).items() if col != name}
+    index = aggregate_store.bitmap_index()
+    if not filters or index is None:
+        return None
+    if name in UNFILTERED_CHARTS:
+        return _mark_unfiltered(_cached_chart_figure(name))
+
+    specs = dashboard_chart_specs(index.filtered_aggregates(filters))
+    if name not in specs:
+        return None
+    builder, args = specs[name]
+    key = (builder.__name__, content_fingerprint(*args))
+    entry = figure_cache.get(key)
+    if entry is None:
+        entry = figure_cache.put(key, render_figure(builder, args)[0])
+    return entry.figure
+
+
+def _cached_chart_figure(name: str):
+    cached_dashboard, _, _ = _get_cached_dashboard()
+    if cached_dashboard is None:
+        return None
+    return cached_dashboard["charts"].get(name)
+
+
+@app.callback(
+    dash.dependencies.Output({"type": "lazy-graph", "index": dash.dependencies.MATCH}, "figure"),
+    [
+        dash.dependencies.Input({"type": "lazy-graph", "index": dash.dependencies.MATCH}, "id"),
+        dash.dependencies.Input("cross-filter", "data"),
+    ],
+)
+def load_lazy_chart(graph_id, filters):
+    """Serve one below-the-fold figure when its graph mounts or the cross-filter changes."""
+    figure = cross_filtered_figure(graph_id["index"], filters) or _cached_chart_figure(graph_id["index"])
+    return dash.no_update if figure is None else figure
+
+
+@app.callback(
+    dash.dependencies.Output({"type": "priority-graph", "index": dash.dependencies.MATCH}, "figure"),
+    [dash.dependencies.Input("cross-filter", "data")],
+    [dash.dependencies.State({"type": "priority-graph", "index": dash.dependencies.MATCH}, "id")],
+)
+def filter_priority_chart(filters, graph_id):
+    """Re-filter a priority card. Cards arrive with their unfiltered figure, so an unfiltered mount sends nothing."""
+    figure = cross_filtered_figure(graph_id["index"], filters)
+    if figure is None and dash.ctx.triggered_id == "cross-filter":
+        figure = _cached_chart_figure(graph_id["index"])
+    return dash.no_update if figure is None else figure
+
+
+@app.callback(
+    dash.dependencies.Output("cross-filter", "data"),
+    [
+        dash.dependencies.Input({"type": "priority-graph", "index": dash.dependencies.ALL}, "clickData"),
+        dash.dependencies.Input({"type": "lazy-graph", "index": dash.dependencies.ALL}, "clickData"),
+        dash.dependencies.Input("clear-cross-filter", "n_clicks"),
+    ],
+    [dash.dependencies.State("cross-filter", "data")],
+    prevent_initial_call=True,
+)
+def update_cross_filter(_priority_clicks, _lazy_clicks, _clear_clicks, filters):
+    """Toggle ``chart -> clicked label`` in the filter; bars carry their label as customdata."""
+    triggered = dash.ctx.triggered_id
+    if triggered == "clear-cross-filter":
+        return {}
+    click = dash.ctx.triggered[0]["value"] if dash.ctx.triggered else None
+    if not isinstance(triggered, dict) or not click or not click.get("points"):
+        return dash.no_update
+    customdata = click["points"][0].get("customdata")
+    if not customdata:
+        return dash.no_update
+
+    filters = dict(filters or {})
+    col, label = triggered["index"], str(customdata[0])
+    if filters.get(col) == label:
+        filters.pop(col)
+    else:
+        filters[col] = label
+    return filters
+
+
+@app.callback(
+    [
+        dash.dependencies.Output("cross-filter-summary", "children"),
+        dash.dependencies.Output("cross-filter-bar", "style"),
+    ],
+    [dash.dependencies.Input("cross-filter", "data")],
+)
+def update_cross_filter_summary(filters):
+    if not filters:
+        return "", {"display": "none"}
+    selection = ", ".join(f"{col} = {label}" for col, label in filters.items())
+    index = aggregate_store.bitmap_index()
+    if index is None:
+        # Served from another worker's build; have this worker load its own store and index.
+        scheduler.trigger("refresh")
+        summary = f"Cross-filter on {selection} is not available yet; charts show all responses. Try again shortly."
+    else:
+        summary = f"Filtered to {selection} ({index.count(filters):,} responses)"
+    bar_style = {"fontFamily": "Arial", "fontSize": "14px", "marginBottom": "12px"}
+    return summary, bar_style
 
 
-if PREWARM_CACHE_ON_START:
-    _cache_refresh_in_progress = True
-    threading.Thread(target=_refresh_dashboard_cache, daemon=True).start()
+# Build pool children import this module only to render charts.
+if multiprocessing.parent_process() is None:
+    load_startup_snapshot()
 
 
 if __name__ == "__main__":
+    debug = os.getenv("DASH_DEBUG", "false").lower() == "true"
+    # With the debug reloader only the child process that serves requests runs jobs.
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        scheduler.start()
     app.run_server(
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8050")),
-        debug=os.getenv("DASH_DEBUG", "false").lower() == "true",
+        debug=debug,
     )
@@ -0,0 +1,219 @@
+"""Offline benchmark for the refresh pipeline, run against the local stand-ins.
+
+Each stage (sheet read, normalization, encoding, aggregation, chart building,
+serialization, SQL sync and reload, cross-filtering) is timed on synthetic
+responses at every requested size, then run once more under tracemalloc for its
+peak memory. Results are merged into a JSON file keyed by commit, so two
+commits can be compared:
+
+    python benchmark.py --sizes 1000,10000,100000
+    python benchmark.py --compare abc1234   # run, then compare with abc1234
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("PREWARM_CACHE_ON_START", "false")
+os.environ.setdefault("DASHBOARD_SHARED_CACHE_PATH", "")
+os.environ.setdefault("SNAPSHOT_DIR", "")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import plotly.io
+
+import app
+import standins
+
+
+DEFAULT_SIZES = "1000,10000,100000"
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+
+def current_commit() -> str:
+    """Short HEAD hash, suffixed with ``-dirty`` when tracked files have changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty.stdout.strip() else "")
+
+
+def _use_database(path: str) -> None:
+    """Point app at a new SQLite file, as if the process had just started against it."""
+    app.get_db_connection = standins.sqlite_connection_factory(path)
+    app.db_pool.close_all()
+    app._sync_schema_ready = False
+    app._sync_unique_key_ready = False
+
+
+def _sync_into_fresh_database(context):
+    handle, path = tempfile.mkstemp(suffix=".sqlite3", dir=context["workdir"])
+    os.close(handle)
+    _use_database(path)
+    worksheet = standins.FakeWorksheet(standins.SURVEY_HEADER, context["rows"])
+    app.sheets_reader = app.SheetsReader(lambda: worksheet)
+    app.aggregate_store = app.AggregateStore()
+    context["database"] = path
+    return ()
+
+
+def _read_sheet(worksheet):
+    return app.SheetsReader(lambda: worksheet).read()
+
+
+def _rebuild_from_sql():
+    conn = app.get_db_connection()
+    try:
+        app.AggregateStore().rebuild_from_sql(conn)
+    finally:
+        conn.close()
+
+
+def _build_dashboard_children(aggregates):
+    app.figure_cache = app.FigureCache(app.FIGURE_CACHE_SIZE)
+    return app.build_dashboard_children(aggregates)
+
+
+def _count_bars(aggregates):
+    return [
+        app.count_bar(counts, col, split_multiselect=app.is_multiselect_column(col))
+        for col, counts in aggregates.value_counts.items()
+    ]
+
+
+def _cross_filter(responses, filters):
+    index = app.BitmapIndex(responses)
+    return index, index.filtered_aggregates(filters)
+
+
+def _first_answer(aggregates, col):
+    counts = aggregates.value_counts.get(col)
+    return {} if counts is None or counts.empty else {col: str(counts.index[0])}
+
+
+# (name, prepare, run): ``prepare(context)`` returns the arguments for ``run``
+# outside the timed section; ``run``'s result is kept in ``context[name]`` for
+# the stages after it.
+STAGES = [
+    (
+        "sheets_read",
+        lambda context: (standins.FakeWorksheet(standins.SURVEY_HEADER, context["rows"]),),
+        _read_sheet,
+    ),
+    ("normalize", lambda context: (context["sheets_read"],), app.normalize_dataframe_columns),
+    ("encode", lambda context: (context["normalize"],), app.EncodedResponses.from_frame),
+    ("aggregates", lambda context: (context["encode"],), lambda responses: responses.aggregates()),
+    ("count_bar", lambda context: (context["aggregates"],), _count_bars),
+    ("build_dashboard_children", lambda context: (context["aggregates"],), _build_dashboard_children),
+    (
+        "figure_serialization",
+        lambda context: (context["count_bar"],),
+        lambda figures: [plotly.io.to_json(figure) for figure in figures],
+    ),
+    ("sync_to_sql", _sync_into_fresh_database, app.sync_google_sheet_to_mysql),
+    ("rebuild_from_sql", lambda context: (), _rebuild_from_sql),
+    (
+        "cross_filter",
+        lambda context: (context["encode"], _first_answer(context["aggregates"], "platform")),
+        _cross_filter,
+    ),
+]
+
+
+def run_stage(context, prepare, run, repeat: int) -> dict:
+    seconds = []
+    result = None
+    for _ in range(repeat):
+        args = prepare(context)
+        started = time.perf_counter()
+        result = run(*args)
+        seconds.append(time.perf_counter() - started)
+
+    args = prepare(context)
+    with app.track_peak_memory(True) as memory:
+        run(*args)
+    return result, {
+        "min_seconds": round(min(seconds), 6),
+        "median_seconds": round(statistics.median(seconds), 6),
+        "peak_bytes": memory["peak_bytes"],
+    }
+
+
+def run_size(size: int, repeat: int, seed: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        context = {"rows": standins.synthetic_responses(size, seed=seed), "workdir": workdir}
+        stages = {}
+        for name, prepare, run in STAGES:
+            context[name], stages[name] = run_stage(context, prepare, run, repeat)
+            print(f"{size:>9} rows  {name:<26} {stages[name]['median_seconds'] * 1000:>10.1f} ms"
+                  f"  peak {stages[name]['peak_bytes'] / 1e6:>8.1f} MB", flush=True)
+        app.db_pool.close_all()
+    return stages
+
+
+def compare(results: dict, baseline: str, candidate: str) -> None:
+    """Print the median-time and peak-memory ratios of ``candidate`` over ``baseline``."""
+    for label in (baseline, candidate):
+        if label not in results:
+            sys.exit(f"No results recorded for {label!r}; have: {', '.join(results) or 'none'}")
+    before, after = results[baseline]["sizes"], results[candidate]["sizes"]
+    print(f"{candidate} vs {baseline} (ratio > 1 is slower / larger)")
+    for size in sorted(set(before) & set(after), key=int):
+        for name in after[size]:
+            if name not in before[size]:
+                continue
+            old, new = before[size][name], after[size][name]
+            time_ratio = new["median_seconds"] / old["median_seconds"] if old["median_seconds"] else float("nan")
+            memory_ratio = new["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else float("nan")
+            print(f"{int(size):>9} rows  {name:<26} time x{time_ratio:6.2f}  memory x{memory_ratio:6.2f}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated row counts, e.g. 1000,1000000")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (median and min are kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file results are merged into")
+    parser.add_argument("--commit", default=None, help="label for this run (default: short HEAD hash)")
+    parser.add_argument("--compare", metavar="COMMIT", help="compare against results recorded for COMMIT")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if os.path.exists(args.output):
+        with open(args.output) as handle:
+            results = json.load(handle)
+    commit = args.commit or current_commit()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    run = results.setdefault(commit, {"sizes": {}})
+    run.update(
+        {
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "build_workers": app.DASHBOARD_BUILD_WORKERS,
+            "build_executor": app.DASHBOARD_BUILD_EXECUTOR,
+        }
+    )
+    for size in sizes:
+        run["sizes"][str(size)] = run_size(size, args.repeat, args.seed)
+
+    with open(args.output, "w") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+    print(f"Results for {commit} written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare, commit)
+
+
+if __name__ == "__main__":
+    main()
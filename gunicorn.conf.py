@@ -0,0 +1,17 @@
+"""Gunicorn hooks that tie the app's background scheduler to each worker's lifetime.
+
+Gunicorn loads ./gunicorn.conf.py automatically; render.yaml also passes it explicitly.
+"""
+
+
+def post_worker_init(worker):
+    import app
+
+    app.scheduler.start()
+
+
+def worker_exit(server, worker):
+    import app
+
+    app.scheduler.stop()
+    app.save_store_snapshot_on_exit()
@@ -0,0 +1,304 @@
+"""Load test for the dashboard poll under gunicorn, against the local stand-ins.
+
+For each ``--configs`` entry (``WORKERSxTHREADS``) a gunicorn server is started
+with gunicorn.conf.py on a SQLite database and a fake worksheet of synthetic
+responses. ``--clients`` simulated browsers then poll the ``update_dashboard``
+callback through ``/_dash-update-component`` every ``--poll-seconds``, sending
+their last data version like the real page. With ``--append-rate`` the sheet
+keeps growing, so the background sync and refresh rebuild while the load runs.
+For each run it reports p50/p95/p99 latency, throughput and response bytes:
+
+    python loadtest.py --configs 1x4,2x4,4x2 --clients 10,50,200 --duration 30
+    python loadtest.py --url http://127.0.0.1:8050 --clients 50   # an already running server
+
+Gunicorn imports ``create_server()`` from this module in each worker, which
+points app at the stand-ins before the worker hooks start the scheduler.
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+
+DEFAULT_OUTPUT = "loadtest_results.json"
+STARTUP_TIMEOUT_SECONDS = 120
+
+POLL_REQUEST = {
+    "output": "..dashboard-content.children...dashboard-version.data..",
+    "outputs": [
+        {"id": "dashboard-content", "property": "children"},
+        {"id": "dashboard-version", "property": "data"},
+    ],
+    "inputs": [{"id": "refresh-interval", "property": "n_intervals", "value": 0}],
+    "changedPropIds": ["refresh-interval.n_intervals"],
+    "state": [{"id": "dashboard-version", "property": "data", "value": None}],
+}
+
+
+def create_server():
+    """Gunicorn app factory: the Dash server wired to the stand-ins named in LOADTEST_* env vars."""
+    import app
+    import standins
+
+    rows = int(os.environ["LOADTEST_ROWS"])
+    append_rate = float(os.environ.get("LOADTEST_APPEND_RATE", "0"))
+    started_at = float(os.environ["LOADTEST_STARTED_AT"])
+    responses = standins.synthetic_responses(
+        rows + int(append_rate * float(os.environ["LOADTEST_MAX_SECONDS"])), seed=int(os.environ["LOADTEST_SEED"])
+    )
+
+    class GrowingWorksheet(standins.FakeWorksheet):
+        """Reveals ``append_rate`` more rows per second; every worker sees the same sheet."""
+
+        def _grow(self) -> None:
+            visible = min(len(responses), rows + int(append_rate * (time.time() - started_at)))
+            if len(self.values) - 1 < visible:
+                self.append_rows(responses[len(self.values) - 1 : visible])
+
+        def get_all_values(self):
+            self._grow()
+            return super().get_all_values()
+
+        def batch_get(self, ranges):
+            self._grow()
+            return super().batch_get(ranges)
+
+    worksheet = GrowingWorksheet(standins.SURVEY_HEADER, responses[:rows])
+    app.get_db_connection = standins.sqlite_connection_factory(os.environ["LOADTEST_DB"])
+    app.sheets_reader = app.SheetsReader(lambda: worksheet)
+    return app.server
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    position = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[position]
+
+
+class PollingClient(threading.Thread):
+    """One browser tab: polls the dashboard callback and remembers the version it holds."""
+
+    def __init__(self, url: str, poll_seconds: float, stop: threading.Event, offset: float):
+        super().__init__(daemon=True)
+        parsed = urllib.parse.urlsplit(url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.path = parsed.path.rstrip("/") + "/_dash-update-component"
+        self.poll_seconds = poll_seconds
+        self.stop = stop
+        self.offset = offset
+        self.version = None
+        self.samples = []
+        self.errors = 0
+
+    def poll(self, conn, n_intervals: int) -> None:
+        request = json.loads(json.dumps(POLL_REQUEST))
+        request["inputs"][0]["value"] = n_intervals
+        request["state"][0]["value"] = self.version
+        body = json.dumps(request)
+        started = time.perf_counter()
+        conn.request("POST", self.path, body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        payload = response.read()
+        elapsed = time.perf_counter() - started
+        self.samples.append((elapsed, response.status, len(payload)))
+        if response.status == 200:
+            self.version = json.loads(payload)["response"]["dashboard-version"]["data"]
+        elif response.status != 204:
+            self.errors += 1
+
+    def run(self) -> None:
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        n_intervals = 0
+        # Spread the first polls over one interval, as tabs opened at different times would be.
+        if self.stop.wait(self.offset):
+            return
+        while not self.stop.is_set():
+            started = time.perf_counter()
+            n_intervals += 1
+            try:
+                self.poll(conn, n_intervals)
+            except (OSError, http.client.HTTPException, ValueError, KeyError):
+                self.errors += 1
+                conn.close()
+            self.stop.wait(max(0.0, self.poll_seconds - (time.perf_counter() - started)))
+        conn.close()
+
+
+def run_clients(url: str, clients: int, duration: float, poll_seconds: float) -> dict:
+    stop = threading.Event()
+    threads = [PollingClient(url, poll_seconds, stop, poll_seconds * index / clients) for index in range(clients)]
+    started = time.time()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=65)
+    elapsed = time.time() - started
+
+    samples = [sample for thread in threads for sample in thread.samples]
+    latencies = sorted(sample[0] for sample in samples)
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample[1])] = statuses.get(str(sample[1]), 0) + 1
+    total_bytes = sum(sample[2] for sample in samples)
+    return {
+        "clients": clients,
+        "requests": len(samples),
+        "errors": sum(thread.errors for thread in threads),
+        "statuses": statuses,
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else float("nan"),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else float("nan"),
+        "response_bytes": total_bytes,
+        "bytes_per_second": round(total_bytes / elapsed, 1),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_serving(url: str, process, timeout: float) -> None:
+    """Wait for a poll that returns a dashboard, i.e. the first build has been published."""
+    parsed = urllib.parse.urlsplit(url)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=60)
+            conn.request(
+                "POST", parsed.path.rstrip("/") + "/_dash-update-component", body=json.dumps(POLL_REQUEST),
+                headers={"Content-Type": "application/json"},
+            )
+            response = conn.getresponse()
+            payload = response.read()
+            conn.close()
+            if response.status == 200 and json.loads(payload)["response"]["dashboard-version"]["data"]:
+                return
+        except (OSError, http.client.HTTPException, ValueError, KeyError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"{url} did not serve a dashboard within {timeout:.0f}s")
+
+
+def start_gunicorn(workers: int, threads: int, args, workdir: str):
+    port = _free_port()
+    env = dict(os.environ)
+    env.update(
+        {
+            "LOADTEST_DB": os.path.join(workdir, "survey.sqlite3"),
+            "LOADTEST_ROWS": str(args.rows),
+            "LOADTEST_SEED": str(args.seed),
+            "LOADTEST_APPEND_RATE": str(args.append_rate),
+            "LOADTEST_STARTED_AT": repr(time.time()),
+            "LOADTEST_MAX_SECONDS": str(STARTUP_TIMEOUT_SECONDS + args.duration * len(args.clients) + 60),
+            "DASHBOARD_SHARED_CACHE_PATH": os.path.join(workdir, "dashboard-cache.sqlite3"),
+            "SNAPSHOT_DIR": "",
+            "PREWARM_CACHE_ON_START": "true",
+            "SYNC_INTERVAL_SECONDS": str(args.sync_seconds),
+            "DASHBOARD_CACHE_SECONDS": str(args.refresh_seconds),
+            "LOG_LEVEL": env.get("LOG_LEVEL", "WARNING"),
+        }
+    )
+    command = [
+        sys.executable, "-m", "gunicorn", "loadtest:create_server()",
+        "--config", "gunicorn.conf.py",
+        "--workers", str(workers),
+        "--threads", str(threads),
+        "--timeout", "120",
+        "--bind", f"127.0.0.1:{port}",
+    ]
+    log = open(os.path.join(workdir, "gunicorn.log"), "w")
+    process = subprocess.Popen(
+        command, cwd=os.path.dirname(os.path.abspath(__file__)), env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+    return process, f"http://127.0.0.1:{port}", log
+
+
+def run_config(label: str, url: str, args) -> list:
+    runs = []
+    for clients in args.clients:
+        result = run_clients(url, clients, args.duration, args.poll_seconds)
+        result["config"] = label
+        runs.append(result)
+        print(
+            f"{label:<10} {clients:>6} clients  {result['throughput_rps']:>8.1f} req/s  "
+            f"p50 {result['p50_ms']:>8.1f} ms  p95 {result['p95_ms']:>8.1f} ms  p99 {result['p99_ms']:>8.1f} ms  "
+            f"{result['bytes_per_second'] / 1e3:>9.1f} kB/s  errors {result['errors']}",
+            flush=True,
+        )
+    return runs
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", default="1x4", help="comma-separated gunicorn WORKERSxTHREADS shapes")
+    parser.add_argument("--clients", default="10,50", help="comma-separated concurrent client counts")
+    parser.add_argument("--duration", type=float, default=20, help="seconds of load per client count")
+    parser.add_argument("--poll-seconds", type=float, default=1.0, help="seconds between each client's polls")
+    parser.add_argument("--rows", type=int, default=10000, help="synthetic responses in the sheet at start")
+    parser.add_argument("--append-rate", type=float, default=0, help="rows appended to the sheet per second")
+    parser.add_argument("--sync-seconds", type=int, default=10, help="SYNC_INTERVAL_SECONDS for the server")
+    parser.add_argument("--refresh-seconds", type=int, default=30, help="DASHBOARD_CACHE_SECONDS for the server")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="load an already running server instead of starting gunicorn")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file the results are written to")
+    args = parser.parse_args(argv)
+    args.clients = [int(count) for count in args.clients.split(",") if count.strip()]
+
+    results = []
+    if args.url:
+        wait_until_serving(args.url, None, STARTUP_TIMEOUT_SECONDS)
+        results.extend(run_config("external", args.url, args))
+    else:
+        for shape in args.configs.split(","):
+            workers, threads = (int(part) for part in shape.lower().split("x"))
+            with tempfile.TemporaryDirectory() as workdir:
+                process, url, log = start_gunicorn(workers, threads, args, workdir)
+                try:
+                    wait_until_serving(url, process, STARTUP_TIMEOUT_SECONDS)
+                    results.extend(run_config(f"{workers}x{threads}", url, args))
+                except RuntimeError:
+                    log.flush()
+                    with open(log.name) as handle:
+                        sys.stderr.write(handle.read()[-4000:])
+                    raise
+                finally:
+                    process.terminate()
+                    try:
+                        process.wait(timeout=30)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                    log.close()
+
+    with open(args.output, "w") as handle:
+        json.dump(
+            {
+                "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "settings": {key: value for key, value in vars(args).items() if key != "output"},
+                "runs": results,
+            },
+            handle,
+            indent=2,
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Local stand-ins for the external services app.py talks to.
+
+Everything here runs offline so the sync and dashboard paths can be exercised
+without MySQL or Google Sheets credentials, e.g.:
+
+    import app, standins
+    app.get_db_connection = standins.sqlite_connection_factory("survey.sqlite3")
+    app.sheets_reader = app.SheetsReader(lambda: standins.FakeWorksheet(header, rows))
+
+``synthetic_responses`` produces ``rows`` for ``SURVEY_HEADER``.
+"""
+import json
+import random
+import re
+import sqlite3
+from datetime import datetime, timedelta
+
+from app import RESPONSE_COLUMNS
+
+
+SURVEY_RESPONSES_DDL = (
+    "CREATE TABLE IF NOT EXISTS survey_responses (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+    + ", ".join(f"{column} TEXT" for column in RESPONSE_COLUMNS)
+    + ")"
+)
+
+_MYSQL_TO_SQLITE = [
+    (re.compile(r"%s"), "?"),
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.IGNORECASE), "INSERT OR IGNORE"),
+    (re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.IGNORECASE), "ON CONFLICT DO UPDATE SET"),
+    (re.compile(r"\bVALUES\((\w+)\)", re.IGNORECASE), r"excluded.\1"),
+]
+
+
+def translate_mysql(sql: str) -> str:
+    for pattern, replacement in _MYSQL_TO_SQLITE:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+class SQLiteCursor:
+    """DB-API cursor that accepts the MySQL dialect used in app.py."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(translate_mysql(sql), params or ())
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._cursor.executemany(translate_mysql(sql), seq_of_params)
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+class SQLiteConnection:
+    """Connection with the subset of the mysql.connector API app.py relies on."""
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute(SURVEY_RESPONSES_DDL)
+        self._conn.commit()
+
+    def cursor(self, *args, **kwargs):
+        return SQLiteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0):
+        self._conn.execute("SELECT 1")
+
+    def is_connected(self) -> bool:
+        try:
+            self.ping()
+            return True
+        except sqlite3.Error:
+            return False
+
+
+def sqlite_connection_factory(path: str):
+    """Return a zero-argument factory usable in place of app.get_db_connection."""
+
+    def connect():
+        return SQLiteConnection(path)
+
+    return connect
+
+
+def _column_number(letters: str) -> int:
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def _parse_a1_range(range_name: str):
+    """Parse the A1 forms SheetsReader uses: ``"1:1"``, ``"A5:O"`` and ``"A5:O9"``."""
+    start, _, end = range_name.partition(":")
+    start_match = re.fullmatch(r"([A-Za-z]*)(\d*)", start)
+    end_match = re.fullmatch(r"([A-Za-z]*)(\d*)", end or start)
+    first_col = _column_number(start_match.group(1)) if start_match.group(1) else 1
+    last_col = _column_number(end_match.group(1)) if end_match.group(1) else None
+    first_row = int(start_match.group(2)) if start_match.group(2) else 1
+    last_row = int(end_match.group(2)) if end_match.group(2) else None
+    return first_row, last_row, first_col, last_col
+
+
+class FakeWorksheet:
+    """In-memory gspread worksheet that counts API calls and bytes served."""
+
+    def __init__(self, header, rows=()):
+        self.values = [list(header)] + [list(row) for row in rows]
+        self.api_calls = 0
+        self.bytes_served = 0
+
+    def _serve(self, values):
+        self.api_calls += 1
+        self.bytes_served += len(json.dumps(values, default=str))
+        return values
+
+    def append_row(self, row) -> None:
+        self.values.append(list(row))
+
+    def append_rows(self, rows) -> None:
+        self.values.extend(list(row) for row in rows)
+
+    def _range_values(self, range_name: str):
+        first_row, last_row, first_col, last_col = _parse_a1_range(range_name)
+        selected = self.values[first_row - 1 : last_row]
+        result = []
+        for row in selected:
+            cells = [str(value) for value in row[first_col - 1 : last_col]]
+            while cells and cells[-1] == "":
+                cells.pop()
+            result.append(cells)
+        while result and not result[-1]:
+            result.pop()
+        return result
+
+    def get_all_values(self):
+        width = max((len(row) for row in self.values), default=0)
+        return self._serve([[str(value) for value in row] + [""] * (width - len(row)) for row in self.values])
+
+    def get_all_records(self):
+        header, *rows = self.get_all_values()
+        return [dict(zip(header, row)) for row in rows]
+
+    def get(self, range_name: str):
+        return self._serve(self._range_values(range_name))
+
+    def batch_get(self, ranges):
+        return self._serve([self._range_values(range_name) for range_name in ranges])
+
+
+# Sheet headers as the Spanish-language form exports them; each resolves to a
+# COLUMN_ALIASES entry except "Edad", which stays a plain numeric column.
+SURVEY_HEADER = [
+    "Marca temporal",
+    "Play frequency",
+    "Plataforma",
+    "What game genres do you enjoy the most? (Select up to 2)",
+    "Matters most",
+    "Preferencia",
+    "Story importance",
+    "Romance importance",
+    "Romance engagement",
+    "Romance preference",
+    "Player gender",
+    "Gender identity",
+    "Orientation importance",
+    "Sexual orientation",
+    "Inclusive interest",
+    "Edad",
+]
+
+# (choices, weights) per header column; "" is an unanswered optional question.
+ANSWER_CHOICES = {
+    "Play frequency": (["Daily", "A few times a week", "Weekly", "Monthly", "Rarely"], [30, 30, 20, 12, 8]),
+    "Plataforma": (["PC", "PlayStation", "Xbox", "Nintendo Switch", "Mobile", "Other"], [35, 25, 12, 14, 12, 2]),
+    "Matters most": (["Story", "Gameplay", "Graphics", "Characters", "Music"], [30, 40, 8, 18, 4]),
+    "Preferencia": (["Single player", "Multiplayer", "Both"], [45, 20, 35]),
+    "Story importance": (["1", "2", "3", "4", "5"], [4, 8, 20, 33, 35]),
+    "Romance importance": (["1", "2", "3", "4", "5"], [18, 22, 28, 20, 12]),
+    "Romance engagement": (["Always", "Sometimes", "Never", ""], [25, 45, 22, 8]),
+    "Romance preference": (["Same gender", "Different gender", "Any", "None", ""], [15, 35, 30, 12, 8]),
+    "Player gender": (["Male", "Female", "Custom", "Depends on the game"], [35, 30, 10, 25]),
+    "Gender identity": (["Man", "Woman", "Non-binary", "Prefer not to say", ""], [46, 40, 8, 3, 3]),
+    "Orientation importance": (["Not important", "Somewhat important", "Very important", ""], [40, 35, 20, 5]),
+    "Sexual orientation": (
+        ["Heterosexual", "Bisexual", "Gay", "Lesbian", "Asexual", "Prefer not to say", ""],
+        [55, 18, 8, 6, 4, 6, 3],
+    ),
+    "Inclusive interest": (["Yes", "No", "Maybe"], [45, 20, 35]),
+}
+
+GENRES = ["RPG", "Action", "Adventure", "Strategy", "Simulation", "Puzzle", "Horror", "Sports", "Visual novel"]
+GENRE_WEIGHTS = [22, 18, 16, 9, 8, 7, 7, 6, 7]
+
+
+def _sheet_timestamp(moment: datetime) -> str:
+    return f"{moment.day}/{moment.month}/{moment.year} {moment:%H:%M:%S}"
+
+
+def synthetic_responses(count: int, seed: int = 0, start: datetime = datetime(2025, 1, 1), span_days: int = 365):
+    """Return ``count`` rows for ``SURVEY_HEADER`` with realistic answer mixes.
+
+    Timestamps are unique, ascending and spread over ``span_days`` in the
+    sheet's day-first format. Genres pick up to two options like the form.
+    Answers are drawn from shared string objects, so a million rows stay cheap.
+    """
+    rng = random.Random(seed)
+    step = timedelta(seconds=max(1, span_days * 86400 // max(count, 1)))
+    genre_answers = {}
+    ages = [str(age) for age in range(13, 71)]
+    age_weights = [max(1, 40 - abs(age - 24) * 2) for age in range(13, 71)]
+
+    columns = []
+    for name in SURVEY_HEADER:
+        if name == "Marca temporal":
+            columns.append([_sheet_timestamp(start + step * index) for index in range(count)])
+        elif name.startswith("What game genres"):
+            picks = rng.choices([0, 1, 2], weights=[4, 36, 60], k=count)
+            answers = []
+            for picked in picks:
+                text = ", ".join(dict.fromkeys(rng.choices(GENRES, GENRE_WEIGHTS, k=picked)))
+                answers.append(genre_answers.setdefault(text, text))
+            columns.append(answers)
+        elif name == "Edad":
+            columns.append(rng.choices(ages, weights=age_weights, k=count))
+        else:
+            choices, weights = ANSWER_CHOICES[name]
+            columns.append(rng.choices(choices, weights=weights, k=count))
+    return [list(row) for row in zip(*columns)]
@@ -0,0 +1,88 @@
+"""Shared fixtures: app runs offline against standins, with no scheduler, snapshot or shared cache."""
+import os
+import sys
+from datetime import datetime, timedelta
+
+os.environ.update(
+    {
+        "PREWARM_CACHE_ON_START": "false",
+        "DASHBOARD_SHARED_CACHE_PATH": "",
+        "SNAPSHOT_DIR": "",
+        "DASHBOARD_BUILD_WORKERS": "1",
+        "LOG_LEVEL": "WARNING",
+    }
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+import app
+import standins
+
+
+# Recent enough that every response falls inside the TREND_DAYS window.
+RECENT_START = datetime.now() - timedelta(days=120)
+
+
+def survey_rows(count: int, seed: int = 0, after_days: int = 0, span_days: int = 90):
+    """Synthetic responses starting ``after_days`` past RECENT_START, so appended rows have new timestamps."""
+    start = RECENT_START + timedelta(days=after_days)
+    return standins.synthetic_responses(count, seed=seed, start=start, span_days=span_days)
+
+
+def frame_of(rows):
+    """Normalize sheet-shaped rows the way a sheet read would."""
+    return app.normalize_dataframe_columns(pd.DataFrame(rows, columns=standins.SURVEY_HEADER))
+
+
+@pytest.fixture
+def responses():
+    """1,000 normalized responses."""
+    return frame_of(survey_rows(1000))
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Point app at an empty SQLite database, as if the process had just started against it."""
+    monkeypatch.setattr(app, "get_db_connection", standins.sqlite_connection_factory(str(tmp_path / "survey.sqlite3")))
+    monkeypatch.setattr(app, "_sync_schema_ready", False)
+    monkeypatch.setattr(app, "_sync_unique_key_ready", False)
+    monkeypatch.setattr(app, "aggregate_store", app.AggregateStore())
+    app.db_pool.close_all()
+    yield app.get_db_connection
+    app.db_pool.close_all()
+
+
+@pytest.fixture
+def worksheet(monkeypatch):
+    """A fake sheet of 300 responses that ``app.sheets_reader`` reads from."""
+    sheet = standins.FakeWorksheet(standins.SURVEY_HEADER, survey_rows(300))
+    monkeypatch.setattr(app, "sheets_reader", app.SheetsReader(lambda: sheet))
+    return sheet
+
+
+def sheet_frame(sheet):
+    """The whole fake sheet, read and normalized from scratch."""
+    return app.normalize_dataframe_columns(app.SheetsReader(lambda: sheet).read())
+
+
+def answer_options(value) -> list:
+    """Distinct options of one multiselect answer, split by hand as the reference for app's vectorized split."""
+    text = "" if value is None or value != value else str(value)
+    parts = [part.strip() for part in text.replace(";", ",").split(",") if part.strip()]
+    return list(dict.fromkeys(parts)) or ["Missing"]
+
+
+@pytest.fixture
+def served_store(monkeypatch, responses):
+    """A sheets-mode store holding ``responses`` and the dashboard built from it, as after a refresh."""
+    store = app.AggregateStore()
+    store._replace(app.EncodedResponses.from_frame(responses), "sheets", len(responses))
+    monkeypatch.setattr(app, "aggregate_store", store)
+    monkeypatch.setattr(app, "figure_cache", app.FigureCache(256))
+    for name in ("_cached_dashboard", "_cached_dashboard_version", "_last_dashboard_epoch"):
+        monkeypatch.setattr(app, name, getattr(app, name))
+    dashboard, version = app.build_dashboard(store.snapshot())
+    app._set_cached_dashboard(dashboard, 1.0, version, publish=False)
+    return store
@@ -0,0 +1,64 @@
+"""Column alias resolution, cached per header signature."""
+import pandas as pd
+import pytest
+
+import app
+import standins
+
+
+def reference_columns(columns) -> list:
+    """The original per-load renaming, one DataFrame.rename per matched alias."""
+    frame = pd.DataFrame(columns=[str(column).strip() for column in columns])
+    lower_to_actual = {column.lower(): column for column in frame.columns}
+    normalized_to_actual = {app.normalize_text(column): column for column in frame.columns}
+    for canonical, candidates in app.COLUMN_ALIASES.items():
+        existing = lower_to_actual.get(canonical)
+        if existing:
+            if existing != canonical:
+                frame = frame.rename(columns={existing: canonical})
+            continue
+        for candidate in candidates:
+            actual = lower_to_actual.get(candidate.lower()) or normalized_to_actual.get(app.normalize_text(candidate))
+            if actual:
+                frame = frame.rename(columns={actual: canonical})
+                break
+    return list(frame.columns)
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        standins.SURVEY_HEADER,
+        app.RESPONSE_COLUMNS,
+        ["id", " Platform ", "Marca temporal", "Story Importance"],
+        # The canonical name wins over an alias present in the same header.
+        ["timestamp", "Marca temporal", "plataforma", "Platform"],
+        ["Narrative importance", "Story importance", "Gender identity", "Sexual orientation"],
+        ["What game genres do you enjoy the most? (Select up to 2)", "Preferencia", "unrelated"],
+    ],
+)
+def test_resolved_names_match_the_rename_order_of_the_original(header):
+    assert list(app.resolve_column_aliases(tuple(header))) == reference_columns(header)
+
+
+def test_alias_plan_is_cached_per_header():
+    app.resolve_column_aliases.cache_clear()
+    frame = pd.DataFrame([[1, 2]], columns=["Marca temporal", "Plataforma"])
+    first = app.normalize_dataframe_columns(frame)
+    second = app.normalize_dataframe_columns(frame.copy())
+
+    assert list(first.columns) == list(second.columns) == ["timestamp", "platform"]
+    info = app.resolve_column_aliases.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert list(frame.columns) == ["Marca temporal", "Plataforma"]
+
+
+def test_response_rows_are_strings_with_none_for_missing_cells():
+    frame = pd.DataFrame({"timestamp": ["1/2/2025 10:00:00", None], "platform": ["PC", float("nan")], "age": [21, 30]})
+    rows = app.dataframe_to_response_rows(frame)
+
+    index = {column: position for position, column in enumerate(app.RESPONSE_COLUMNS)}
+    assert len(rows) == 2 and all(len(row) == len(app.RESPONSE_COLUMNS) for row in rows)
+    assert (rows[0][index["timestamp"]], rows[0][index["platform"]]) == ("1/2/2025 10:00:00", "PC")
+    assert (rows[1][index["timestamp"]], rows[1][index["platform"]]) == (None, None)
+    assert all(rows[0][index[column]] is None for column in app.RESPONSE_COLUMNS if column not in frame.columns)
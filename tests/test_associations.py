@@ -0,0 +1,42 @@
+"""The all-pairs Cramér's V matrix, checked against pandas."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import app
+
+
+def cramers_v(frame, left, right) -> float:
+    observed = pd.crosstab(frame[left], frame[right]).to_numpy(dtype=float)
+    total = observed.sum()
+    expected = np.outer(observed.sum(axis=1), observed.sum(axis=0)) / total
+    chi_square = ((observed - expected) ** 2 / expected).sum()
+    return float(np.sqrt(chi_square / (total * (min(observed.shape) - 1))))
+
+
+def test_cramers_v_matches_pandas(responses):
+    matrix = app.association_matrix(app.EncodedResponses.from_frame(responses))
+    assert len(matrix.columns) > 2
+    for position, left in enumerate(matrix.columns):
+        for right in matrix.columns[position + 1 :]:
+            assert matrix.loc[left, right] == pytest.approx(cramers_v(responses, left, right))
+            assert matrix.loc[right, left] == matrix.loc[left, right]
+
+
+def test_store_associations_follow_appended_rows(responses):
+    store = app.AggregateStore()
+    store._replace(app.EncodedResponses.from_frame(responses.iloc[:600]), "sheets", 600)
+    store.snapshot()
+    store.apply_rows(responses.iloc[600:], 1000)
+    pd.testing.assert_frame_equal(
+        store.snapshot().associations, app.association_matrix(app.EncodedResponses.from_frame(responses))
+    )
+
+
+def test_heatmap_is_labelled_unfiltered_under_a_cross_filter(served_store):
+    served_store.update_bitmap_index()
+    figure = app.cross_filtered_figure("associations", {"platform": "PC"})
+    cached = app._cached_chart_figure("associations")
+    assert figure["data"] == cached["data"]
+    assert figure["layout"]["title"]["text"].endswith("(all responses, not cross-filtered)</i>")
+    assert "not cross-filtered" not in cached["layout"]["title"]["text"]
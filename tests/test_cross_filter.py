@@ -0,0 +1,70 @@
+"""Cross-filtering from the packed bitmap index, checked against pandas."""
+import pandas as pd
+import pytest
+
+import app
+from conftest import answer_options
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"platform": "PC"},
+        {"genres": "RPG"},
+        {"platform": "PC", "genres": "Horror"},
+        {"story_importance": "5", "romance_importance": "1"},
+    ],
+)
+def test_bitmap_filter_counts_match_pandas(responses, filters):
+    index = app.BitmapIndex(app.EncodedResponses.from_frame(responses))
+
+    selected = pd.Series(True, index=responses.index)
+    for col, label in filters.items():
+        if app.is_multiselect_column(col):
+            options = responses[col].map(answer_options)
+            selected &= options.map(lambda picked: label in picked)
+        else:
+            selected &= responses[col].astype(str) == label
+    subset = responses[selected]
+    assert 0 < len(subset) < len(responses)
+
+    assert index.count(filters) == len(subset)
+    filtered = index.filtered_aggregates(filters)
+    assert filtered.row_count == len(subset)
+    expected = app.EncodedResponses.from_frame(subset).aggregates()
+    for col, counts in expected.value_counts.items():
+        assert app._labelled_counts(filtered.value_counts[col]).equals(app._labelled_counts(counts))
+    assert app._labelled_counts(filtered.option_counts["genres"]).equals(
+        app._labelled_counts(expected.option_counts["genres"])
+    )
+
+
+def test_filters_wait_for_the_refresh_job_to_build_the_index(served_store):
+    filters = {"platform": "PC"}
+    assert app.cross_filtered_figure("genres", filters) is None
+    summary, _ = app.update_cross_filter_summary(filters)
+    assert "not available yet" in summary
+
+    served_store.update_bitmap_index()
+    figure = app.cross_filtered_figure("genres", filters)
+    assert figure is not None
+    summary, _ = app.update_cross_filter_summary(filters)
+    assert summary == f"Filtered to platform = PC ({served_store.bitmap_index().count(filters):,} responses)"
+
+
+def test_a_chart_ignores_its_own_filter(served_store):
+    served_store.update_bitmap_index()
+    assert app.cross_filtered_figure("platform", {"platform": "PC"}) is None
+    assert app.cross_filtered_figure("platform", {"platform": "PC", "genres": "RPG"}) is not None
+
+
+def test_index_is_rebuilt_only_when_the_store_changed(served_store, responses):
+    served_store.update_bitmap_index()
+    index = served_store.bitmap_index()
+    served_store.update_bitmap_index()
+    assert served_store.bitmap_index() is index
+
+    served_store.apply_rows(responses.iloc[:10], len(responses) + 10)
+    served_store.update_bitmap_index()
+    assert served_store.bitmap_index() is not index
+    assert served_store.bitmap_index().row_count == len(responses) + 10
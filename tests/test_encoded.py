@@ -0,0 +1,38 @@
+"""Dictionary-encoded responses against pandas, and the one multiselect split they share with SQL."""
+import numpy as np
+import pandas as pd
+
+import app
+from conftest import answer_options, sheet_frame
+
+GENRE_ANSWERS = ["RPG, Action", "RPG; Horror", "", None, np.nan, "Action, Action", " , ;", "Puzzle"]
+
+
+def test_split_multiselect_pairs_rows_with_distinct_options():
+    pairs = app.split_multiselect(GENRE_ANSWERS)
+    expected = [(row, option) for row, value in enumerate(GENRE_ANSWERS) for option in answer_options(value)]
+    assert list(pairs.itertuples(index=False, name=None)) == expected
+
+
+def test_store_options_table_and_chart_fallback_split_alike():
+    frame = pd.DataFrame({"genres": GENRE_ANSWERS, "platform": ["PC"] * len(GENRE_ANSWERS)})
+    responses = app.EncodedResponses.from_frame(frame.iloc[:3])
+    responses.append(frame.iloc[3:])
+    store_counts = app._labelled_counts(responses.aggregates().option_counts["genres"])
+
+    rows = app.explode_option_rows(range(101, 101 + len(frame)), frame)
+    table_counts = pd.Series([value for _, _, value in rows]).value_counts().sort_index()
+    fallback_counts = app._labelled_counts(app.split_multiselect_counts(frame["genres"].value_counts(dropna=False)))
+
+    assert store_counts.to_dict() == table_counts.to_dict() == fallback_counts.to_dict()
+    assert store_counts.to_dict() == {"Action": 2, "Horror": 1, "Missing": 4, "Puzzle": 1, "RPG": 2}
+    assert {response_id for response_id, _, _ in rows} == set(range(101, 101 + len(frame)))
+
+
+def test_aggregates_match_pandas_value_counts(worksheet):
+    frame = sheet_frame(worksheet)
+    aggregates = app.EncodedResponses.from_frame(frame).aggregates()
+    assert aggregates.row_count == len(frame)
+    for col, counts in aggregates.value_counts.items():
+        expected = frame[col].value_counts(dropna=False)
+        assert app._labelled_counts(counts).equals(app._labelled_counts(expected))
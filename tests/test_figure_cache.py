@@ -0,0 +1,53 @@
+"""Serialized figures memoized by chart builder and input fingerprint."""
+import pandas as pd
+import pytest
+
+import app
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = app.FigureCache(max_entries=2)
+    cache.put("a", '{"data": []}')
+    cache.put("b", '{"data": []}')
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", '{"data": []}')
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 1}
+
+
+def test_entries_keep_the_payload_size():
+    cache = app.FigureCache(max_entries=1)
+    entry = cache.put("a", '{"data": [1, 2]}')
+    assert entry.payload_bytes == len('{"data": [1, 2]}')
+    assert cache.get("a").figure == {"data": [1, 2]}
+
+
+def test_fingerprint_follows_content_not_identity():
+    counts = pd.Series({"PC": 3, "Console": 2})
+    assert app.content_fingerprint(counts, "Platform") == app.content_fingerprint(counts.copy(), "Platform")
+    assert app.content_fingerprint(counts, "Platform") != app.content_fingerprint(counts + 1, "Platform")
+    assert app.content_fingerprint(counts, "Platform") != app.content_fingerprint(counts, "Other title")
+
+
+@pytest.fixture
+def figure_cache(monkeypatch):
+    cache = app.FigureCache(256)
+    monkeypatch.setattr(app, "figure_cache", cache)
+    return cache
+
+
+def test_rebuild_renders_only_charts_whose_inputs_changed(figure_cache, responses):
+    responses = app.EncodedResponses.from_frame(responses)
+    charts = len(app.build_dashboard_figures(responses.aggregates()))
+    assert figure_cache.stats()["misses"] == charts
+
+    assert len(app.build_dashboard_figures(responses.aggregates())) == charts
+    assert figure_cache.stats()["hits"] == charts
+
+    aggregates = responses.aggregates()
+    aggregates.value_counts["platform"] = aggregates.value_counts["platform"] + 1
+    app.build_dashboard_figures(aggregates)
+    assert figure_cache.stats()["misses"] == charts + 1
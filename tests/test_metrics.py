@@ -0,0 +1,57 @@
+"""Prometheus text rendering of the metrics registry and the /metrics endpoint."""
+import app
+
+
+def test_histogram_renders_cumulative_buckets_count_and_sum():
+    histogram = app.Histogram("demo_seconds", "Demo stage time.", ["stage"])
+    for value in (0.003, 0.2, 100.0):
+        histogram.observe(value, stage="sync")
+
+    lines = histogram.render().splitlines()
+    assert lines[:2] == ["# HELP demo_seconds Demo stage time.", "# TYPE demo_seconds histogram"]
+    buckets = {
+        line.split('le="')[1].split('"')[0]: float(line.rsplit(" ", 1)[1])
+        for line in lines
+        if line.startswith("demo_seconds_bucket")
+    }
+    assert list(buckets) == [repr(bound) for bound in app.Histogram.buckets] + ["+Inf"]
+    assert buckets["0.005"] == 1
+    assert buckets["0.1"] == 1
+    assert buckets["0.25"] == 2
+    assert buckets["60.0"] == 2
+    assert buckets["+Inf"] == 3
+    assert list(buckets.values()) == sorted(buckets.values())
+    assert 'demo_seconds_bucket{stage="sync",le="0.25"} 2.0' in lines
+    assert 'demo_seconds_count{stage="sync"} 3.0' in lines
+    assert 'demo_seconds_sum{stage="sync"} 100.203' in lines
+
+
+def test_each_label_set_gets_its_own_series():
+    histogram = app.Histogram("demo_seconds", "Demo stage time.", ["stage"])
+    histogram.observe(1.0, stage="b")
+    histogram.observe(1.0, stage="a")
+    counts = [line for line in histogram.render().splitlines() if line.startswith("demo_seconds_count")]
+    assert counts == ['demo_seconds_count{stage="a"} 1.0', 'demo_seconds_count{stage="b"} 1.0']
+
+
+def test_label_values_and_special_floats_are_escaped():
+    counter = app.Counter("demo_total", "Demo.", ["route"])
+    counter.inc(route='/a"b\\c\nd')
+    assert 'demo_total{route="/a\\"b\\\\c\\nd"} 1.0' in counter.render().splitlines()
+
+    gauge = app.Gauge("demo_age_seconds", "Demo.", function=lambda: float("nan"))
+    assert gauge.render().splitlines()[-1] == "demo_age_seconds NaN"
+
+
+def test_timed_stages_are_served_on_the_metrics_endpoint():
+    @app.timed("test_stage")
+    def stage():
+        return "done"
+
+    assert stage() == "done"
+    response = app.server.test_client().get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert "# TYPE survey_stage_seconds histogram" in body
+    assert 'survey_stage_seconds_count{stage="test_stage"} 1.0' in body
@@ -0,0 +1,58 @@
+"""The survey_response_options bridge table filled at sync time."""
+import collections
+
+import app
+from conftest import answer_options, sheet_frame, survey_rows
+
+
+def sql_option_counts(connect) -> dict:
+    conn = connect()
+    try:
+        counts = app.fetch_sql_option_counts(conn.cursor())
+    finally:
+        conn.close()
+    return {column: series.sort_index().to_dict() for column, series in counts.items()}
+
+
+def sheet_option_counts(sheet) -> dict:
+    genres = collections.Counter(option for value in sheet_frame(sheet)["genres"] for option in answer_options(value))
+    return {"genres": dict(sorted(genres.items()))}
+
+
+def test_sync_stores_each_selected_option(database, worksheet):
+    app.sync_google_sheet_to_mysql()
+    worksheet.append_rows(survey_rows(60, seed=3, after_days=91, span_days=5))
+    app.sync_google_sheet_to_mysql()
+
+    assert sql_option_counts(database) == sheet_option_counts(worksheet)
+
+
+def test_rows_stored_before_the_table_existed_are_backfilled(database, worksheet, monkeypatch):
+    app.sync_google_sheet_to_mysql()
+    conn = database()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM survey_response_options")
+        cursor.execute("DELETE FROM sync_state WHERE name = %s", (app.OPTIONS_STATE_KEY,))
+        conn.commit()
+    finally:
+        conn.close()
+    assert sql_option_counts(database) == {}
+
+    monkeypatch.setattr(app, "_sync_schema_ready", False)
+    conn = database()
+    try:
+        app.ensure_sync_schema(conn)
+    finally:
+        conn.close()
+    assert sql_option_counts(database) == sheet_option_counts(worksheet)
+
+
+def test_rows_with_stored_timestamps_add_no_options(database, worksheet):
+    app.sync_google_sheet_to_mysql()
+    # Same timestamps as rows already stored, different answers: the inserts are ignored.
+    worksheet.append_rows(survey_rows(300, seed=4)[:50])
+    assert app.sync_google_sheet_to_mysql() == 0
+
+    del worksheet.values[301:]
+    assert sql_option_counts(database) == sheet_option_counts(worksheet)
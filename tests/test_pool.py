@@ -0,0 +1,117 @@
+"""The bounded MySQL connection pool and the health check built on it."""
+import threading
+
+import pytest
+
+import app
+import standins
+
+
+class Connection(standins.SQLiteConnection):
+    """SQLite connection whose ping can be made to fail."""
+
+    def __init__(self):
+        super().__init__()
+        self.alive = True
+        self.closed = False
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0):
+        if not self.alive:
+            raise ConnectionError("server has gone away")
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def pool(size: int = 1, timeout: float = 0.2, recycle_seconds: int = 3600, pre_ping: bool = True):
+    return app.ConnectionPool(Connection, size, timeout, recycle_seconds, pre_ping)
+
+
+def test_checkout_reuses_idle_connections():
+    connections = pool(size=2)
+    with connections.connection() as first:
+        pass
+    with connections.connection() as second:
+        assert second is first
+    assert connections.stats()["created"] == 1
+    assert connections.stats()["checkouts"] == 2
+
+
+def test_checkout_times_out_when_the_pool_is_exhausted():
+    connections = pool(size=1, timeout=0.05)
+    with connections.connection():
+        with pytest.raises(TimeoutError):
+            connections.acquire()
+    stats = connections.stats()
+    assert (stats["timeouts"], stats["in_use"], stats["open"]) == (1, 0, 1)
+
+
+def test_waiting_checkout_gets_the_released_connection():
+    connections = pool(size=1, timeout=5)
+    held = connections.acquire()
+    released = threading.Timer(0.05, connections.release, args=(held,))
+    released.start()
+    with connections.connection() as conn:
+        assert conn is held
+    released.join()
+    assert connections.stats()["waits"] == 1
+
+
+def test_old_connections_are_recycled(monkeypatch):
+    connections = pool(recycle_seconds=60)
+    with connections.connection() as first:
+        pass
+    created = connections._created_at[id(first)]
+    monkeypatch.setattr(app.time, "time", lambda: created + 61)
+    with connections.connection() as second:
+        assert second is not first
+    assert first.closed
+    assert connections.stats()["recycled"] == 1
+
+
+def test_pre_ping_replaces_dead_connections():
+    connections = pool()
+    with connections.connection() as first:
+        pass
+    first.alive = False
+    with connections.connection() as second:
+        assert second is not first
+    assert connections.stats()["invalidated"] == 1
+
+
+def test_without_pre_ping_idle_connections_are_handed_out_as_is():
+    connections = pool(pre_ping=False)
+    with connections.connection() as first:
+        pass
+    first.alive = False
+    with connections.connection() as second:
+        assert second is first
+
+
+def unreachable_database():
+    raise ConnectionError("MySQL is down")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app, "get_db_connection", unreachable_database)
+    app.db_pool.close_all()
+    return app.server.test_client()
+
+
+def test_healthz_skips_the_database_in_sheets_mode(client, monkeypatch):
+    monkeypatch.setattr(app, "DASHBOARD_SOURCE", "sheets")
+    checkouts = app.db_pool.stats()["checkouts"]
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json["database"] == "not used"
+    assert response.json["pool"]["checkouts"] == checkouts == app.db_pool.stats()["checkouts"]
+
+
+def test_healthz_reports_an_unreachable_database_in_sql_mode(client, monkeypatch):
+    monkeypatch.setattr(app, "DASHBOARD_SOURCE", "sql")
+    response = client.get("/healthz")
+    assert response.status_code == 503
+    assert "MySQL is down" in response.json["database"]
+    assert "pool" in response.json
@@ -0,0 +1,84 @@
+"""Refreshes across worker processes sharing one dashboard cache file."""
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each worker reads its own fake sheet, so its API call count shows whether it fetched.
+WORKER = """
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+import app, standins
+
+sheet = standins.FakeWorksheet(standins.SURVEY_HEADER, standins.synthetic_responses({rows}))
+app.sheets_reader = app.SheetsReader(lambda: sheet)
+open(os.path.join({workdir!r}, f"ready-{{os.getpid()}}"), "w").close()
+while not os.path.exists(os.path.join({workdir!r}, "go")):
+    time.sleep(0.001)
+
+app.scheduler.run_job("refresh")
+app._wait_for_dashboard(30)
+_, _, version = app._get_cached_dashboard()
+print(json.dumps({{"api_calls": sheet.api_calls, "rows": app.aggregate_store.responses.row_count, "version": version}}))
+"""
+
+
+def start_workers(tmp_path, count: int, rows: int = 500):
+    env = dict(
+        os.environ,
+        DASHBOARD_SOURCE="sheets",
+        SYNC_FROM_GOOGLE_SHEETS="false",
+        DASHBOARD_SHARED_CACHE_PATH=str(tmp_path / "dashboard-cache.sqlite3"),
+        SNAPSHOT_DIR="",
+        PREWARM_CACHE_ON_START="false",
+        DASHBOARD_BUILD_WORKERS="1",
+        LOG_LEVEL="WARNING",
+    )
+    script = WORKER.format(root=ROOT, workdir=str(tmp_path), rows=rows)
+    return [
+        subprocess.Popen([sys.executable, "-c", script], env=env, stdout=subprocess.PIPE, text=True)
+        for _ in range(count)
+    ]
+
+
+def run_workers(tmp_path, workers) -> list:
+    """Release the workers together once all have imported app; return what each reported."""
+    try:
+        deadline = time.time() + 120
+        while len(list(tmp_path.glob("ready-*"))) < len(workers):
+            assert time.time() < deadline, "workers did not start"
+            assert all(worker.poll() is None for worker in workers), "a worker exited early"
+            time.sleep(0.05)
+        (tmp_path / "go").touch()
+        outputs = [worker.communicate(timeout=120)[0] for worker in workers]
+    finally:
+        for worker in workers:
+            worker.kill()
+        for ready in tmp_path.glob("ready-*"):
+            ready.unlink()
+        (tmp_path / "go").unlink(missing_ok=True)
+
+    assert [worker.returncode for worker in workers] == [0] * len(workers)
+    return [json.loads(output.strip().splitlines()[-1]) for output in outputs]
+
+
+def test_concurrent_refresh_fetches_once(tmp_path):
+    results = run_workers(tmp_path, start_workers(tmp_path, 4))
+
+    assert sorted(result["api_calls"] > 0 for result in results) == [False, False, False, True]
+    assert len({result["version"] for result in results}) == 1
+    assert results[0]["version"] is not None
+
+
+def test_restarted_worker_reconciles_an_older_shared_build(tmp_path):
+    (first,) = run_workers(tmp_path, start_workers(tmp_path, 1, rows=100))
+    assert first["rows"] == 100
+
+    # A worker started after that build, against a grown sheet, rebuilds on its first scheduled run.
+    (restarted,) = run_workers(tmp_path, start_workers(tmp_path, 1, rows=500))
+    assert restarted["api_calls"] > 0
+    assert restarted["rows"] == 500
+    assert restarted["version"] != first["version"]
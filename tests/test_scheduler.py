@@ -0,0 +1,107 @@
+"""The background scheduler that runs the sync and refresh jobs."""
+import threading
+import time
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(app, "SCHEDULER_JITTER_RATIO", 0.0)
+    monkeypatch.setattr(app, "SCHEDULER_RETRY_SECONDS", 5.0)
+    monkeypatch.setattr(app, "SCHEDULER_MAX_BACKOFF_SECONDS", 60.0)
+
+
+def failing_job(triggered):
+    raise RuntimeError("sheet unavailable")
+
+
+def test_failures_back_off_exponentially_up_to_the_cap(no_jitter):
+    scheduler = app.BackgroundScheduler()
+    scheduler.add_job("sync", failing_job, 120)
+    job = scheduler._jobs["sync"]
+    assert job.next_delay() == 120
+
+    delays = []
+    for _ in range(6):
+        assert scheduler.run_job("sync") is None
+        delays.append(job.next_delay())
+    assert delays == [5, 10, 20, 40, 60, 60]
+    assert scheduler.stats()["sync"]["failures"] == 6
+    assert "sheet unavailable" in scheduler.stats()["sync"]["last_error"]
+
+
+def test_a_success_resets_the_backoff(no_jitter):
+    outcomes = iter([RuntimeError("down"), RuntimeError("down"), 0])
+
+    def flaky(triggered):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    scheduler = app.BackgroundScheduler()
+    scheduler.add_job("sync", flaky, 120)
+    for _ in range(3):
+        scheduler.run_job("sync")
+    assert scheduler._jobs["sync"].next_delay() == 120
+    assert scheduler.stats()["sync"]["failures"] == 0
+    assert scheduler.stats()["sync"]["runs"] == 3
+
+
+def test_jitter_stays_within_the_ratio(monkeypatch):
+    monkeypatch.setattr(app, "SCHEDULER_JITTER_RATIO", 0.1)
+    job = app.ScheduledJob("refresh", lambda triggered: None, 100)
+    assert all(90 <= job.next_delay() <= 110 for _ in range(200))
+
+
+def test_truthy_result_triggers_the_chained_job():
+    scheduler = app.BackgroundScheduler()
+    results = iter([0, 3])
+    scheduler.add_job("sync", lambda triggered: next(results), 120, chain="refresh")
+    scheduler.add_job("refresh", lambda triggered: None, 300)
+    refresh = scheduler._jobs["refresh"]
+
+    scheduler.run_job("sync")
+    assert not refresh.wake.is_set()
+    scheduler.run_job("sync")
+    assert refresh.wake.is_set()
+
+
+def test_a_job_never_overlaps_itself():
+    started, release = threading.Event(), threading.Event()
+
+    def slow(triggered):
+        started.set()
+        release.wait(5)
+        return "done"
+
+    scheduler = app.BackgroundScheduler()
+    scheduler.add_job("refresh", slow, 300)
+    worker = threading.Thread(target=scheduler.run_job, args=("refresh",))
+    worker.start()
+    started.wait(5)
+    assert scheduler.run_job("refresh") is None
+    release.set()
+    worker.join(5)
+    assert scheduler.stats()["refresh"]["runs"] == 1
+
+
+def test_threads_run_triggered_jobs_and_stop():
+    ran = []
+    scheduler = app.BackgroundScheduler()
+    scheduler.add_job("sync", lambda triggered: ran.append(triggered), 3600, run_immediately=False)
+    scheduler.start()
+    try:
+        assert scheduler.running
+        scheduler.trigger("sync")
+        deadline = time.time() + 5
+        while not ran and time.time() < deadline:
+            time.sleep(0.01)
+        assert ran == [True]
+    finally:
+        scheduler.stop(timeout=5)
+    assert not scheduler.running
+    assert not any(thread.name.startswith("scheduler-sync") and thread.is_alive() for thread in threading.enumerate())
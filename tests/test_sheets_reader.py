@@ -0,0 +1,50 @@
+"""Append-only Sheets reads through the cached SheetsReader."""
+import app
+import standins
+from conftest import sheet_frame, survey_rows
+
+
+def test_reads_only_rows_past_the_callers_position():
+    sheet = standins.FakeWorksheet(standins.SURVEY_HEADER, survey_rows(300))
+    reader = app.SheetsReader(lambda: sheet)
+    assert len(reader.read()) == 300
+
+    sheet.append_rows(survey_rows(20, seed=1, after_days=91, span_days=5))
+    calls = sheet.api_calls
+    appended = reader.read(300)
+    assert sheet.api_calls == calls + 1
+    assert list(appended.index) == list(range(300, 320))
+    assert appended.iloc[-1].tolist() == reader._clean_row(sheet.values[-1])
+    assert (reader.row_count, reader.full_reads) == (320, 1)
+
+    assert reader.read(320).empty
+    assert reader.full_reads == 1
+
+
+def test_edited_rows_or_header_trigger_a_full_read():
+    sheet = standins.FakeWorksheet(standins.SURVEY_HEADER, survey_rows(300))
+    reader = app.SheetsReader(lambda: sheet)
+    reader.read()
+
+    del sheet.values[11:21]
+    frame = reader.read(300)
+    assert (frame.index.start, len(frame), reader.full_reads) == (0, 290, 2)
+
+    sheet.values[0][-1] = "Renamed question"
+    assert reader.read(290).index.start == 0
+    assert reader.full_reads == 3
+
+
+def test_sheets_store_notices_a_full_read_taken_by_another_caller(worksheet):
+    store = app.AggregateStore()
+    store.refresh_from_sheets(app.sheets_reader)
+    assert store.position == 300
+
+    del worksheet.values[11:21]
+    app.sheets_reader.read(299)  # the sync absorbs the full re-read
+    worksheet.append_rows(survey_rows(20, seed=1, after_days=91, span_days=5))
+
+    store.refresh_from_sheets(app.sheets_reader)
+    assert store.position == 310
+    expected = app.EncodedResponses.from_frame(sheet_frame(worksheet)).aggregates()
+    assert app._aggregates_equal(store.snapshot(), expected)
@@ -0,0 +1,64 @@
+"""Persisting the encoded store as a memory-mapped snapshot."""
+import pandas as pd
+import pytest
+
+import app
+from conftest import frame_of, survey_rows
+
+
+def test_snapshot_round_trip_then_append(tmp_path, responses):
+    store = app.AggregateStore()
+    store._replace(app.EncodedResponses.from_frame(responses), "sheets", len(responses))
+    store.save_snapshot(str(tmp_path), "v1")
+
+    loaded = app.AggregateStore()
+    meta = loaded.load_snapshot(str(tmp_path))
+    assert (meta["source"], meta["position"]) == ("sheets", 1000)
+    assert app._aggregates_equal(loaded.snapshot(), store.snapshot())
+    pd.testing.assert_frame_equal(loaded.snapshot().trends, store.snapshot().trends)
+
+    appended = frame_of(survey_rows(200, seed=1, after_days=91, span_days=5))
+    appended.index = pd.RangeIndex(1000, 1200)
+    loaded.apply_rows(appended, 1200)
+    expected = app.EncodedResponses.from_frame(pd.concat([responses, appended])).aggregates()
+    assert loaded.position == 1200
+    assert app._aggregates_equal(loaded.snapshot(), expected)
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch, responses):
+    monkeypatch.setattr(app, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "SNAPSHOT_INTERVAL_SECONDS", 900)
+    monkeypatch.setattr(app, "_snapshot_store_version", None)
+    monkeypatch.setattr(app, "_snapshot_saved_at", 0.0)
+    store = app.AggregateStore()
+    store._replace(app.EncodedResponses.from_frame(responses), "sheets", len(responses))
+    monkeypatch.setattr(app, "aggregate_store", store)
+    return tmp_path
+
+
+def saved_position(root) -> int:
+    loaded = app.AggregateStore()
+    return loaded.load_snapshot(str(root))["position"]
+
+
+def test_snapshot_writes_are_throttled_until_exit(snapshot_dir, monkeypatch):
+    app.save_store_snapshot("v1")
+    assert saved_position(snapshot_dir) == 1000
+
+    appended = frame_of(survey_rows(10, seed=1, after_days=91, span_days=5))
+    app.aggregate_store.apply_rows(appended, 1010)
+    app.save_store_snapshot("v2")
+    assert saved_position(snapshot_dir) == 1000
+
+    monkeypatch.setattr(app, "_cached_dashboard_version", "v2")
+    app.save_store_snapshot_on_exit()
+    assert saved_position(snapshot_dir) == 1010
+
+
+def test_snapshot_is_written_again_once_the_interval_passed(snapshot_dir, monkeypatch):
+    app.save_store_snapshot("v1")
+    app.aggregate_store.apply_rows(frame_of(survey_rows(10, seed=1, after_days=91, span_days=5)), 1010)
+    monkeypatch.setattr(app, "_snapshot_saved_at", app._snapshot_saved_at - 901)
+    app.save_store_snapshot("v2")
+    assert saved_position(snapshot_dir) == 1010
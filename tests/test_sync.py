@@ -0,0 +1,70 @@
+"""Watermark-based Google Sheets -> SQL sync."""
+import app
+from conftest import survey_rows
+
+
+def stored_rows(connect) -> int:
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM survey_responses")
+        return cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def watermark(connect):
+    conn = connect()
+    try:
+        return app.load_sync_watermark(conn.cursor())
+    finally:
+        conn.close()
+
+
+def test_sync_copies_only_new_rows(database, worksheet):
+    assert app.sync_google_sheet_to_mysql() == 300
+    assert stored_rows(database) == 300
+
+    worksheet.append_rows(survey_rows(40, seed=1, after_days=91, span_days=5))
+    calls = worksheet.api_calls
+    assert app.sync_google_sheet_to_mysql() == 40
+    assert worksheet.api_calls == calls + 1
+    assert app.sheets_reader.full_reads == 1
+    assert stored_rows(database) == 340
+    assert watermark(database) == (340, str(worksheet.values[-1][0]))
+
+
+def test_sync_without_new_rows_is_a_no_op(database, worksheet):
+    app.sync_google_sheet_to_mysql()
+    before = watermark(database)
+
+    assert app.sync_google_sheet_to_mysql() == 0
+    assert stored_rows(database) == 300
+    assert watermark(database) == before
+    assert app.sheets_reader.full_reads == 1
+
+
+def test_sync_replays_after_rows_are_deleted_upstream(database, worksheet):
+    app.sync_google_sheet_to_mysql()
+    del worksheet.values[11:21]
+
+    # The boundary row moved, so the sheet is re-read and replayed; inserts are idempotent.
+    assert app.sync_google_sheet_to_mysql() == 0
+    assert app.sheets_reader.full_reads == 2
+    assert watermark(database)[0] == 290
+
+    worksheet.append_rows(survey_rows(25, seed=2, after_days=91, span_days=5))
+    assert app.sync_google_sheet_to_mysql() == 25
+    assert stored_rows(database) == 325
+
+
+def test_restarted_sync_resumes_from_the_stored_watermark(database, worksheet, monkeypatch):
+    app.sync_google_sheet_to_mysql()
+    worksheet.append_rows(survey_rows(20, seed=1, after_days=91, span_days=5))
+
+    # A new process has no reader state, only the watermark in sync_state.
+    monkeypatch.setattr(app, "sheets_reader", app.SheetsReader(lambda: worksheet))
+    monkeypatch.setattr(app, "_sync_schema_ready", False)
+    assert app.sync_google_sheet_to_mysql() == 20
+    assert stored_rows(database) == 320
+    assert watermark(database)[0] == 320
@@ -0,0 +1,52 @@
+"""Daily trend buckets kept in survey_response_trends and in the store."""
+import pandas as pd
+
+import app
+from conftest import sheet_frame, survey_rows
+
+
+def test_trend_table_matches_the_store(database, worksheet):
+    app.sync_google_sheet_to_mysql()
+    worksheet.append_rows(survey_rows(60, seed=3, after_days=91, span_days=5))
+    app.sync_google_sheet_to_mysql()
+
+    conn = database()
+    try:
+        store = app.AggregateStore()
+        store.rebuild_from_sql(conn)
+        sql_trends = app.fetch_sql_trends(conn.cursor())
+    finally:
+        conn.close()
+
+    assert not sql_trends.empty
+    pd.testing.assert_frame_equal(sql_trends, store.snapshot().trends)
+    assert sql_trends[sql_trends["column"] == "responses"]["count"].sum() == len(sheet_frame(worksheet))
+
+
+def test_trend_counts_match_pandas(responses):
+    counts = app.trend_counts(responses)
+    days = pd.to_datetime(responses["timestamp"], dayfirst=True).dt.strftime("%Y-%m-%d")
+    expected = {(day, "responses", "all"): count for day, count in days.value_counts().items()}
+    for col in app.TREND_COLUMNS:
+        grouped = pd.DataFrame({"day": days, "value": responses[col].astype(str)}).value_counts()
+        expected.update({(day, col, value): count for (day, value), count in grouped.items()})
+    assert dict(counts) == expected
+
+
+def test_timestamps_parse_day_first_unless_iso():
+    days = app.timestamp_days(["2/1/2025 10:00:00", "2025-01-03 08:00:00", "not a date", None])
+    assert [str(pd.Timestamp(day, unit="D").date()) if day >= 0 else None for day in days] == [
+        "2025-01-02",
+        "2025-01-03",
+        None,
+        None,
+    ]
+
+
+def test_trend_charts_are_labelled_unfiltered_under_a_cross_filter(served_store):
+    served_store.update_bitmap_index()
+    names = ["responses_per_day", *(f"{col}_trend" for col in app.TREND_COLUMNS)]
+    for name in names:
+        figure = app.cross_filtered_figure(name, {"platform": "PC"})
+        assert figure["data"] == app._cached_chart_figure(name)["data"]
+        assert figure["layout"]["title"]["text"].endswith("(all responses, not cross-filtered)</i>")